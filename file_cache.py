@@ -0,0 +1,60 @@
+import functools
+import os
+import pickle
+import re
+import threading
+import time
+from datetime import date
+
+
+class FileCache:
+    """Pickle-backed cache that stores one file per key under a cache directory"""
+
+    def __init__(self, directory='.cache'):
+        self.directory = directory
+
+    def _path(self, key):
+        safe_key = re.sub(r'[^A-Za-z0-9_.-]', '_', key)
+        return os.path.join(self.directory, f"{safe_key}.pkl")
+
+    def get(self, key, ttl):
+        """Return the cached value if it is younger than ttl (a timedelta), else None"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl.total_seconds():
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def set(self, key, value):
+        """Store a value, writing to a temporary file first so readers never see partial data"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"Warning: Could not write cache entry {key}: {e}")
+
+
+def cached(cache, ttl, should_cache=bool):
+    """
+    Decorator that keeps a function's result in cache for ttl, keyed by function name, arguments and today's date
+    Results rejected by should_cache (empty ones by default) are returned but not stored
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = '-'.join([func.__name__, *map(str, args), date.today().strftime('%Y%m%d')])
+            value = cache.get(key, ttl)
+            if value is None:
+                value = func(*args)
+                if should_cache(value):
+                    cache.set(key, value)
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def moving_averages(values, *windows):
+    """Simple moving averages for several windows computed from one cumulative-sum pass.
+    Like pandas rolling(window).mean(), a position is NaN until the window is full
+    or while the window contains a NaN."""
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    cumsum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+    cum_missing = np.concatenate(([0], np.cumsum(missing)))
+
+    averages = []
+    for window in windows:
+        average = np.full(values.shape, np.nan)
+        if len(values) >= window:
+            window_sums = cumsum[window:] - cumsum[:-window]
+            window_missing = cum_missing[window:] - cum_missing[:-window]
+            average[window - 1:] = np.where(window_missing == 0, window_sums / window, np.nan)
+        averages.append(average)
+    return averages
@@ -1,30 +1,78 @@
-import os
+import io
+import re
+import threading
 import yfinance as yf
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache, partial
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.dml import MSO_THEME_COLOR, MSO_FILL
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+from file_cache import FileCache
+from indicators import moving_averages
+
+# On-disk cache of Yahoo Finance payloads so repeated runs for a ticker skip the network
+file_cache = FileCache('.cache')
+CACHE_TTL = {
+    'info': timedelta(hours=24),
+    'history': timedelta(hours=24),
+    'financials': timedelta(days=90),
+    'balance_sheet': timedelta(days=90)
+}
+
+# --- layout constants ---
+# Lengths and colors are immutable, so they are built once instead of on every slide
+BG_COLOR = RGBColor(44, 48, 53)  # #2C3035
+TITLE_COLOR = RGBColor(171, 146, 255)  # Light purple-blue color
+WHITE_TEXT = RGBColor(255, 255, 255)
+TITLE_SIZE = Pt(32)
+SECTION_SIZE = Pt(18)
+SPACING_SIZE = Pt(9)
+
+COVER_TITLE_BOX = (Inches(1), Inches(3), Inches(8), Inches(1.5))
+TITLE_BOX = (Inches(0.5), Inches(0.5), Inches(9), Inches(1))
+CONTENT_BOX = (Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+BASIC_INFO_BOX = (Inches(0.5), Inches(1.5), Inches(3.5), Inches(2))
+DESCRIPTION_BOX = (Inches(0.5), Inches(4.75), Inches(9), Inches(1.5))
+CHART_LEFT, CHART_TOP, CHART_WIDTH = Inches(4.5), Inches(1.5), Inches(5)
+MARKET_STATS_BOX = (Inches(0.5), Inches(1.5), Inches(6), Inches(5))
+FINANCIAL_TABLE_BOX = (Inches(4), Inches(2), Inches(5.6), Inches(4))
+REVENUE_COLUMN_PADDING = Inches(0.1)
+THESIS_BOX = (Inches(0.75), Inches(1.05), Inches(9), Inches(5))
+
+# Yahoo recommendationKey values, keyed in lowercase to match the lookup
+_RECOMMENDATION_MAP = {
+    'buy': 'Buy',
+    'hold': 'Hold',
+    'sell': 'Sell',
+    'strong_buy': 'Strong Buy',
+    'strong_sell': 'Strong Sell'
+}
+
+# Serializing and zipping a pptx is CPU work that doesn't need to block the caller
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# List of installed fonts - you might need to modify this based on your system
+_AVAILABLE_FONTS = frozenset({'Montserrat', 'Barlow', 'Arial', 'Calibri', 'Helvetica', 'Times New Roman'})
+
+@lru_cache(maxsize=8)
 def get_font_with_fallback(preferred_font, is_title=False):
     """Get font name with fallback options"""
-    try:
-        # List of installed fonts - you might need to modify this based on your system
-        available_fonts = ['Montserrat', 'Barlow', 'Arial', 'Calibri', 'Helvetica', 'Times New Roman']
-        
-        if preferred_font in available_fonts:
-            return preferred_font
-        else:
-            # Default fallbacks
-            if is_title:
-                return 'Arial'  # Fallback for titles
-            return 'Calibri'    # Fallback for body text
-    except:
-        return 'Arial' if is_title else 'Calibri'
+    if preferred_font in _AVAILABLE_FONTS:
+        return preferred_font
+    # Default fallbacks
+    if is_title:
+        return 'Arial'  # Fallback for titles
+    return 'Calibri'    # Fallback for body text
 
 def create_gradient_textbox(slide, left, top, width, height, text):
     """Create a textbox with gradient text and Barlow font with fallback"""
@@ -37,36 +85,55 @@ def create_gradient_textbox(slide, left, top, width, height, text):
     
     run = p.add_run()
     run.text = text
-    run.font.color.rgb = RGBColor(171, 146, 255)  # Light purple-blue color
-    run.font.size = Pt(32)
+    run.font.color.rgb = TITLE_COLOR
+    run.font.size = TITLE_SIZE
     run.font.bold = True
     run.font.name = get_font_with_fallback('Barlow', is_title=True)
     
     return text_box
 
+# Resolved once; every body run on every slide gets the same font
+BODY_FONT = get_font_with_fallback('Montserrat', is_title=False)
+
 def apply_white_text_to_shape(shape):
     """Apply white color and Montserrat font with fallback to all text"""
     if hasattr(shape, "text_frame"):
-        for paragraph in shape.text_frame.paragraphs:
-            for run in paragraph.runs:
-                # Only apply white color to non-title text
-                if run.font.size != Pt(32):  # If not title size
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-                    run.font.name = get_font_with_fallback('Montserrat', is_title=False)
+        # Only apply white color to non-title text
+        runs = [run for paragraph in shape.text_frame.paragraphs
+                for run in paragraph.runs if run.font.size != TITLE_SIZE]
     elif hasattr(shape, "table"):
-        for row in shape.table.rows:
-            for cell in row.cells:
-                for paragraph in cell.text_frame.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.color.rgb = RGBColor(255, 255, 255)
-                        run.font.name = get_font_with_fallback('Montserrat', is_title=False)
-                        
+        runs = [run for row in shape.table.rows for cell in row.cells
+                for paragraph in cell.text_frame.paragraphs for run in paragraph.runs]
+    else:
+        return
+
+    for run in runs:
+        run.font.color.rgb = WHITE_TEXT
+        run.font.name = BODY_FONT
+
+def fill_table_text(table, rows, bold_header=False):
+    """Write one text run per cell straight into the table XML.
+    Much cheaper than the cell.text setter, which clears and rebuilds each cell's paragraphs."""
+    cells = table._tbl.iter(qn('a:tc'))
+    for row_idx, row in enumerate(rows):
+        for value in row:
+            paragraph = next(cells).find(qn('a:txBody')).find(qn('a:p'))
+            run = OxmlElement('a:r')
+            if bold_header and row_idx == 0:
+                run_properties = OxmlElement('a:rPr')
+                run_properties.set('b', '1')
+                run.append(run_properties)
+            text = OxmlElement('a:t')
+            text.text = value
+            run.append(text)
+            paragraph.append(run)
+
 def apply_slide_background(slide):
     """Apply dark background color to slide"""
     background = slide.background
     fill = background.fill
     fill.solid()
-    fill.fore_color.rgb = RGBColor(44, 48, 53)  # #2C3035
+    fill.fore_color.rgb = BG_COLOR
 
 def apply_white_text_to_slide(slide):
     """Apply white text color to all shapes in a slide"""
@@ -74,9 +141,31 @@ def apply_white_text_to_slide(slide):
         if shape != slide.shapes.title:  # Skip the title shape if it exists
             apply_white_text_to_shape(shape)
 
+# One chart Figure is created lazily and reused for every ticker instead of rebuilt per chart
+_chart_figure = None
+_chart_lock = threading.Lock()
+
+def get_chart_figure():
+    """Return the shared (Figure, Axes) pair used for stock price charts"""
+    global _chart_figure
+    if _chart_figure is None:
+        fig = Figure(figsize=(10, 6))
+        _chart_figure = (fig, fig.add_subplot())
+    return _chart_figure
+
+def compute_roi(net_profit, total_assets):
+    """Element-wise ROI in percent for aligned float arrays; 0 where total assets are 0"""
+    net_profit = np.asarray(net_profit, dtype=np.float64)
+    total_assets = np.asarray(total_assets, dtype=np.float64)
+    roi = np.zeros_like(net_profit)
+    np.divide(net_profit * 100.0, total_assets, out=roi, where=total_assets != 0)
+    return roi
+
 class StockPresentationGenerator:
     def __init__(self, ticker):
         self.ticker = ticker.upper()
+        self._cache = {}
+        self._short_description = None
         try:
             self.stock = yf.Ticker(self.ticker)
             self.company_info = self.get_company_info()
@@ -84,10 +173,49 @@ class StockPresentationGenerator:
             print(f"Error initializing stock data: {e}")
             self.company_info = {'name': self.ticker}
 
+    def _fetch(self, name, loader):
+        """Fetch a Ticker payload once and reuse it for the lifetime of the generator"""
+        if name not in self._cache:
+            key = f"{self.ticker}_{name}"
+            value = file_cache.get(key, CACHE_TTL[name])
+            if value is None:
+                value = loader()
+                # Don't persist empty responses, Yahoo returns those when throttling
+                is_empty = value.empty if isinstance(value, pd.DataFrame) else not value
+                if not is_empty:
+                    file_cache.set(key, value)
+            self._cache[name] = value
+        return self._cache[name]
+
+    def _prefetch(self):
+        """Download the Ticker payloads used by the slides concurrently.
+        Price history is left to create_stock_price_chart, which runs on its own thread."""
+        loaders = {
+            'info': lambda: self.stock.info,
+            'financials': lambda: self.stock.financials,
+            'balance_sheet': lambda: self.stock.balance_sheet
+        }
+        pending = {name: loader for name, loader in loaders.items() if name not in self._cache}
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {name: executor.submit(self._fetch, name, loader) for name, loader in pending.items()}
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    # Leave it uncached; the getter will retry and report the error
+                    print(f"Warning: Error prefetching {name}: {e}")
+
+    def _get_info(self):
+        """Return the Ticker info dict, fetched at most once"""
+        return self._fetch('info', lambda: self.stock.info)
+
     def get_company_info(self):
         """Retrieve comprehensive company information"""
         try:
-            info = self.stock.info
+            info = self._get_info()
             return {
                 'name': info.get('longName', self.ticker),
                 'industry': info.get('industry', 'N/A'),
@@ -104,113 +232,100 @@ class StockPresentationGenerator:
     def create_stock_price_chart(self):
         """Create stock price chart with moving averages"""
         try:
-            hist = self.stock.history(period="1y")
-
-            plt.style.use('dark_background')
-            fig = plt.figure(figsize=(10, 6))
-            
-            # Set the figure and axes background color
-            ax = plt.gca()
-            fig.patch.set_facecolor('#2C3035')
-            ax.set_facecolor('#2C3035')
-            
-            # Plot lines with custom colors
-            plt.plot(hist.index, hist['Close'], label='Closing Price', color='#00A1C2', linewidth=2)
-            plt.plot(hist.index, hist['Close'].rolling(window=50).mean(), 
-                    label='50-day MA', color='#7F00B5', linewidth=1.5)
-            plt.plot(hist.index, hist['Close'].rolling(window=200).mean(), 
-                    label='200-day MA', color='#000086', linewidth=1.5)
-
-            # Style the plot
-            plt.title(f"{self.ticker} Stock Price", fontweight='bold', color='white', size=14)
-            plt.xlabel("Date", color='white', size=12)
-            plt.ylabel("Price", color='white', size=12)
-            plt.grid(True, alpha=0.2)
-            
-            # Style the legend
-            plt.legend(facecolor='#2C3035', edgecolor='white')
-            
-            # Style the axis
-            ax.tick_params(colors='white')
-            for spine in ax.spines.values():
-                spine.set_color('white')
-
-            # Save the chart
-            chart_filename = f"{self.ticker}_stock_chart.png"
-            plt.savefig(chart_filename, 
-                       dpi=300, 
-                       bbox_inches='tight', 
-                       facecolor='#2C3035',
-                       edgecolor='none')
-            plt.close()
-
-            return chart_filename
+            hist = self._fetch('history', lambda: self.stock.history(period="1y", interval="1d", actions=False)[['Close']])
+
+            close = hist['Close'].to_numpy()
+            ma_50, ma_200 = moving_averages(close, 50, 200)
+
+            with _chart_lock, plt.style.context('dark_background'):
+                fig, ax = get_chart_figure()
+                ax.cla()
+
+                # Set the figure and axes background color
+                fig.patch.set_facecolor('#2C3035')
+                ax.set_facecolor('#2C3035')
+
+                # Plot lines with custom colors
+                ax.plot(hist.index, close, label='Closing Price', color='#00A1C2', linewidth=2)
+                ax.plot(hist.index, ma_50, label='50-day MA', color='#7F00B5', linewidth=1.5)
+                ax.plot(hist.index, ma_200, label='200-day MA', color='#000086', linewidth=1.5)
+
+                # Style the plot
+                ax.set_title(f"{self.ticker} Stock Price", fontweight='bold', color='white', size=14)
+                ax.set_xlabel("Date", color='white', size=12)
+                ax.set_ylabel("Price", color='white', size=12)
+                ax.grid(True, alpha=0.2)
+
+                # Style the legend
+                ax.legend(facecolor='#2C3035', edgecolor='white')
+
+                # Style the axis
+                ax.tick_params(colors='white')
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+
+                # Render the chart into memory; 120 dpi is plenty for a 5" wide picture on a slide
+                chart_image = io.BytesIO()
+                fig.savefig(chart_image,
+                            format='png',
+                            dpi=120,
+                            bbox_inches='tight',
+                            facecolor='#2C3035',
+                            edgecolor='none')
+
+            chart_image.seek(0)
+            return chart_image
         except Exception as e:
             print(f"Error creating stock price chart: {e}")
             return None
 
     def get_financial_data(self):
-            """Retrieve financial data for the past 4 years"""
-            try:
-                # Get financial data
-                financials = self.stock.financials
-                balance_sheet = self.stock.balance_sheet
-                
-                # Check if we have any data
-                if financials.empty or balance_sheet.empty:
-                    print("No financial data available")
-                    return pd.DataFrame()
-
-                # Get available years (up to 4)
-                years = sorted(financials.columns, reverse=True)
-                years = years[:min(4, len(years))]  # Take up to 4 years
-                
-                if not years:
-                    print("No yearly data available")
-                    return pd.DataFrame()
-
-                data = []
-                for year in years:
-                    try:
-                        # Safely get financial metrics
-                        revenue = financials.loc['Total Revenue', year] / 1e9 if 'Total Revenue' in financials.index else 0
-                        ebit = financials.loc['Operating Income', year] / 1e9 if 'Operating Income' in financials.index else 0
-                        net_profit = financials.loc['Net Income', year] / 1e9 if 'Net Income' in financials.index else 0
-                        
-                        # Safely get total assets
-                        total_assets = balance_sheet.loc['Total Assets', year] / 1e9 if 'Total Assets' in balance_sheet.index else 0
-                        
-                        # Calculate ROI
-                        roi = (net_profit / total_assets * 100) if total_assets != 0 else 0
-
-                        row = {
-                            'Year': year.year,
-                            'Revenue': f"${revenue:.1f}B" if revenue != 0 else "N/A",
-                            'EBIT': f"${ebit:.1f}B" if ebit != 0 else "N/A",
-                            'Net Profit': f"${net_profit:.1f}B" if net_profit != 0 else "N/A",
-                            'ROI': f"{roi:.1f}%" if roi != 0 else "N/A"
-                        }
-                        data.append(row)
-                    except Exception as e:
-                        print(f"Warning: Error processing financial data for {year}: {e}")
-                        row = {
-                            'Year': year.year if hasattr(year, 'year') else 'N/A',
-                            'Revenue': 'N/A',
-                            'EBIT': 'N/A',
-                            'Net Profit': 'N/A',
-                            'ROI': 'N/A'
-                        }
-                        data.append(row)
-
-                return pd.DataFrame(data)
-            except Exception as e:
-                print(f"Error retrieving financial data: {e}")
+        """Retrieve financial data for the past 4 years"""
+        try:
+            # Get financial data
+            financials = self._fetch('financials', lambda: self.stock.financials)
+            balance_sheet = self._fetch('balance_sheet', lambda: self.stock.balance_sheet)
+
+            # Check if we have any data
+            if financials.empty or balance_sheet.empty:
+                print("No financial data available")
                 return pd.DataFrame()
-            
-    def get_analyst_insights(self):
-        """Retrieve analyst insights"""
+
+            # Get available years (up to 4)
+            years = sorted(financials.columns, reverse=True)[:4]
+
+            if not years:
+                print("No yearly data available")
+                return pd.DataFrame()
+
+            # Select every metric for every year in one go; missing labels or years become 0 (shown as N/A)
+            statements = financials.reindex(index=['Total Revenue', 'Operating Income', 'Net Income'], columns=years)
+            statements = statements.apply(pd.to_numeric, errors='coerce').fillna(0) / 1e9
+            total_assets = balance_sheet.reindex(index=['Total Assets'], columns=years).iloc[0]
+            total_assets = pd.to_numeric(total_assets, errors='coerce').fillna(0) / 1e9
+
+            net_profit = statements.loc['Net Income']
+            roi = pd.Series(compute_roi(net_profit.to_numpy(), total_assets.to_numpy()))
+
+            def format_billions(values):
+                return values.map(lambda v: f"${v:.1f}B" if v != 0 else "N/A").to_numpy()
+
+            return pd.DataFrame({
+                'Year': [year.year for year in years],
+                'Revenue': format_billions(statements.loc['Total Revenue']),
+                'EBIT': format_billions(statements.loc['Operating Income']),
+                'Net Profit': format_billions(net_profit),
+                'ROI': roi.map(lambda v: f"{v:.1f}%" if v != 0 else "N/A").to_numpy()
+            })
+        except Exception as e:
+            print(f"Error retrieving financial data: {e}")
+            return pd.DataFrame()
+
+    @cached_property
+    def analyst_insights(self):
+        """Analyst insights, computed once per generator"""
         try:
-            info = self.stock.info
+            info = self._get_info()
             current_price = info.get('currentPrice', 'N/A')
             target_price = info.get('targetMeanPrice', 'N/A')
 
@@ -242,19 +357,12 @@ class StockPresentationGenerator:
 
     def _translate_recommendation(self, rec_key):
         """Translate recommendation key"""
-        translations = {
-            'buy': 'Buy',
-            'hold': 'Hold',
-            'sell': 'Sell',
-            'strongBuy': 'Strong Buy',
-            'strongSell': 'Strong Sell'
-        }
-        return translations.get(str(rec_key).lower(), rec_key)
+        return _RECOMMENDATION_MAP.get(str(rec_key).lower(), rec_key)
 
     def get_financial_health(self):
         """Retrieve financial health metrics"""
         try:
-            info = self.stock.info
+            info = self._get_info()
             return {
                 'cash_position': info.get('totalCash', 'N/A'),
                 'total_debt': info.get('totalDebt', 'N/A'),
@@ -271,7 +379,7 @@ class StockPresentationGenerator:
     def get_dividend_info(self):
         """Retrieve dividend information"""
         try:
-            info = self.stock.info
+            info = self._get_info()
             ex_div_date = info.get('exDividendDate', 'N/A')
             if isinstance(ex_div_date, (int, float)):
                 ex_div_date = datetime.fromtimestamp(ex_div_date).strftime('%Y-%m-%d')
@@ -292,8 +400,9 @@ class StockPresentationGenerator:
                 'dividend_yield': 'N/A'
             }
 
-    def generate_key_strengths_and_catalysts(self):
-        """Generate strengths and catalysts"""
+    @cached_property
+    def strengths_catalysts(self):
+        """Strengths and catalysts, computed once per generator"""
         try:
             industry = self.company_info.get('industry', 'the industry')
             return {
@@ -340,8 +449,7 @@ class StockPresentationGenerator:
     def generate_recommendation(self, strengths, catalysts):
         """Generate recommendation"""
         try:
-            analyst_insights = self.get_analyst_insights()
-            recommendation = analyst_insights['recommendation']
+            recommendation = self.analyst_insights['recommendation']
 
             return f"""Based on our comprehensive analysis, we recommend a {recommendation} rating for {self.company_info['name']}.
 
@@ -355,112 +463,116 @@ The company shows promising potential with strong market positioning and innovat
             print(f"Error generating recommendation: {e}")
             return "Unable to generate recommendation due to insufficient data"
 
+    def _get_short_description(self):
+        """First three sentences of the business summary, computed once"""
+        if self._short_description is None:
+            # Only split off what we keep; the remainder of the summary stays in the last part
+            sentences = re.split(r'\.\s*', self.company_info['description'].strip(), maxsplit=3)
+            self._short_description = '. '.join(s.strip() for s in sentences[:3] if s.strip()) + '.'
+        return self._short_description
+
     def _add_title_to_slide(self, slide, title_text):
         """Add styled title to slide"""
         apply_slide_background(slide)
         
-        left = Inches(0.5)
-        top = Inches(0.5)
-        width = Inches(9)
-        height = Inches(1)
-        
-        return create_gradient_textbox(slide, left, top, width, height, title_text)
+        return create_gradient_textbox(slide, *TITLE_BOX, title_text)
 
  
-    def _generate_overview_slide(self, prs):
-            """Generate overview slide"""
-            slide = prs.slides.add_slide(prs.slide_layouts[6])
-            self._add_title_to_slide(slide, "Company Overview")
-
-            # Basic info box
-            left = Inches(0.5)
-            top = Inches(1.5)
-            width = Inches(3.5)
-            height = Inches(2)
-
-            basic_info_box = slide.shapes.add_textbox(left, top, width, height)
-            basic_tf = basic_info_box.text_frame
-
-            # Company info with bold labels
-            p1 = basic_tf.add_paragraph()
-            run1 = p1.add_run()
-            run1.text = "Company: "
-            run1.font.bold = True
-            run2 = p1.add_run()
-            run2.text = self.company_info['name']
-            p1.add_line_break()
-            p1.add_line_break()
-
-            # Industry
-            p2 = basic_tf.add_paragraph()
-            run3 = p2.add_run()
-            run3.text = "Industry: "
-            run3.font.bold = True
-            run4 = p2.add_run()
-            run4.text = self.company_info['industry']
-            p2.add_line_break()
-            p2.add_line_break()
-
-            # Sector
-            p3 = basic_tf.add_paragraph()
-            run5 = p3.add_run()
-            run5.text = "Sector: "
-            run5.font.bold = True
-            run6 = p3.add_run()
-            run6.text = self.company_info['sector']
-
-            # Stock price chart
-            chart_path = self.create_stock_price_chart()
-            if chart_path:
-                slide.shapes.add_picture(chart_path, Inches(4.5), Inches(1.5), width=Inches(5))
-                os.remove(chart_path)
-
-            # Description box
-            desc_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(4.75), Inches(9), Inches(1.5))
-            desc_tf = desc_box.text_frame
-
-            # Add description
-            description = self.company_info['description']
-            sentences = description.split('.')
-            limited_description = '. '.join(sentence.strip() 
-                                        for sentence in sentences[:3] if sentence.strip()) + '.'
-
-            para = desc_tf.add_paragraph()
-            run_desc1 = para.add_run()
-            run_desc1.text = "Description: "
-            run_desc1.font.bold = True
-            run_desc2 = para.add_run()
-            run_desc2.text = limited_description
-            desc_tf.word_wrap = True
-
-            apply_white_text_to_slide(slide)
-
-    def _generate_market_position_slide(self, prs):
+    def _prepare_overview(self):
+        """Collect the overview slide data"""
+        return {
+            'name': self.company_info['name'],
+            'industry': self.company_info['industry'],
+            'sector': self.company_info['sector'],
+            'description': self._get_short_description()
+        }
+
+    def _render_overview_slide(self, prs, data, chart_future):
+        """Generate overview slide"""
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        self._add_title_to_slide(slide, "Company Overview")
+
+        # Basic info box
+        basic_info_box = slide.shapes.add_textbox(*BASIC_INFO_BOX)
+        basic_tf = basic_info_box.text_frame
+
+        # Company info with bold labels
+        p1 = basic_tf.add_paragraph()
+        run1 = p1.add_run()
+        run1.text = "Company: "
+        run1.font.bold = True
+        run2 = p1.add_run()
+        run2.text = data['name']
+        p1.add_line_break()
+        p1.add_line_break()
+
+        # Industry
+        p2 = basic_tf.add_paragraph()
+        run3 = p2.add_run()
+        run3.text = "Industry: "
+        run3.font.bold = True
+        run4 = p2.add_run()
+        run4.text = data['industry']
+        p2.add_line_break()
+        p2.add_line_break()
+
+        # Sector
+        p3 = basic_tf.add_paragraph()
+        run5 = p3.add_run()
+        run5.text = "Sector: "
+        run5.font.bold = True
+        run6 = p3.add_run()
+        run6.text = data['sector']
+
+        # Stock price chart
+        chart_image = chart_future.result()
+        if chart_image:
+            slide.shapes.add_picture(chart_image, CHART_LEFT, CHART_TOP, width=CHART_WIDTH)
+
+        # Description box
+        desc_box = slide.shapes.add_textbox(*DESCRIPTION_BOX)
+        desc_tf = desc_box.text_frame
+
+        # Add description
+        para = desc_tf.add_paragraph()
+        run_desc1 = para.add_run()
+        run_desc1.text = "Description: "
+        run_desc1.font.bold = True
+        run_desc2 = para.add_run()
+        run_desc2.text = data['description']
+        desc_tf.word_wrap = True
+
+        apply_white_text_to_slide(slide)
+
+    def _prepare_market_position(self):
+        """Format the market statistics and collect the financial table"""
+        market_cap = self.company_info['market_cap']
+        shares_outstanding = self.company_info['shares_outstanding']
+        float_shares = self.company_info['float_shares']
+
+        return {
+            'market_cap': f"${market_cap / 1e12:.1f}T" if isinstance(market_cap, (int, float)) else "N/A",
+            'shares_outstanding': f"{shares_outstanding / 1e9:.1f}B" if isinstance(shares_outstanding, (int, float)) else "N/A",
+            'float_shares': f"{float_shares / 1e9:.1f}B" if isinstance(float_shares, (int, float)) else "N/A",
+            'financial_data': self.get_financial_data()
+        }
+
+    def _render_market_position_slide(self, prs, data):
         """Generate market position slide"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_title_to_slide(slide, "Market Position")
 
         # Content box
-        content_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.5), Inches(6), Inches(5))
+        content_box = slide.shapes.add_textbox(*MARKET_STATS_BOX)
         tf = content_box.text_frame
 
-        # Format values
-        market_cap_t = self.company_info['market_cap'] / 1e12 if isinstance(
-            self.company_info['market_cap'], (int, float)) else 'N/A'
-        shares_out_b = self.company_info['shares_outstanding'] / 1e9 if isinstance(
-            self.company_info['shares_outstanding'], (int, float)) else 'N/A'
-        float_shares_b = self.company_info['float_shares'] / 1e9 if isinstance(
-            self.company_info['float_shares'], (int, float)) else 'N/A'
-
         # Market Statistics header
         p1 = tf.add_paragraph()
         run1 = p1.add_run()
         run1.text = "Market Statistics"
         run1.font.bold = True
         run1.font.underline = True
-        run1.font.size = Pt(18)
+        run1.font.size = SECTION_SIZE
         p1.add_line_break()
         p1.add_line_break()
 
@@ -470,7 +582,7 @@ The company shows promising potential with strong market positioning and innovat
         run2.text = "Market Cap: "
         run2.font.bold = True
         run3 = p2.add_run()
-        run3.text = f"${market_cap_t:.1f}T" if isinstance(market_cap_t, float) else "N/A"
+        run3.text = data['market_cap']
         p2.add_line_break()
         p2.add_line_break()
 
@@ -480,7 +592,7 @@ The company shows promising potential with strong market positioning and innovat
         run4.text = "Shares Outstanding: "
         run4.font.bold = True
         run5 = p3.add_run()
-        run5.text = f"{shares_out_b:.1f}B" if isinstance(shares_out_b, float) else "N/A"
+        run5.text = data['shares_outstanding']
         p3.add_line_break()
         p3.add_line_break()
 
@@ -490,44 +602,38 @@ The company shows promising potential with strong market positioning and innovat
         run6.text = "Float Shares: "
         run6.font.bold = True
         run7 = p4.add_run()
-        run7.text = f"{float_shares_b:.1f}B" if isinstance(float_shares_b, float) else "N/A"
+        run7.text = data['float_shares']
 
         # Financial table
-        financial_data = self.get_financial_data()
+        financial_data = data['financial_data']
         if not financial_data.empty:
             table = slide.shapes.add_table(
                 len(financial_data) + 1,
                 len(financial_data.columns),
-                Inches(4), Inches(2),
-                Inches(5.6), Inches(4)
+                *FINANCIAL_TABLE_BOX
             ).table
 
-            # Add headers
-            for col, header in enumerate(financial_data.columns):
-                cell = table.cell(0, col)
-                cell.text = header
-                cell.text_frame.paragraphs[0].runs[0].font.bold = True
-                if header == 'Revenue':
-                    table.columns[col].width = table.columns[col].width + Inches(0.1)
+            if 'Revenue' in financial_data.columns:
+                col = financial_data.columns.get_loc('Revenue')
+                table.columns[col].width = table.columns[col].width + REVENUE_COLUMN_PADDING
 
-            # Add data
-            for row, (_, data_row) in enumerate(financial_data.iterrows(), start=1):
-                for col, value in enumerate(data_row):
-                    table.cell(row, col).text = str(value)
+            rows = [list(financial_data.columns)] + financial_data.astype(str).values.tolist()
+            fill_table_text(table, rows, bold_header=True)
 
         apply_white_text_to_slide(slide)
 
-    def _generate_strengths_catalysts_slide(self, prs):
+    def _prepare_strengths_catalysts(self):
+        """Collect the strengths and catalysts slide data"""
+        return self.strengths_catalysts
+
+    def _render_strengths_catalysts_slide(self, prs, strengths_catalysts):
         """Generate strengths and catalysts slide"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_title_to_slide(slide, "Key Strengths and Growth Catalysts")
 
-        content_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+        content_box = slide.shapes.add_textbox(*CONTENT_BOX)
         tf = content_box.text_frame
 
-        strengths_catalysts = self.generate_key_strengths_and_catalysts()
-
         # Key Strengths section
         p1 = tf.add_paragraph()
         run1 = p1.add_run()
@@ -554,70 +660,53 @@ The company shows promising potential with strong market positioning and innovat
 
         apply_white_text_to_slide(slide)
 
-    def _generate_investment_thesis_slide(self, prs):
+    def _prepare_investment_thesis(self):
+        """Format each investment thesis section as (heading, lines)"""
+        sections = [
+            ("Financial Health:", self.get_financial_health()),
+            ("Analyst Insights:", self.analyst_insights),
+            ("Dividend Information:", self.get_dividend_info())
+        ]
+        return [
+            (heading, [f"{key.replace('_', ' ').title()}: {value}" for key, value in values.items()])
+            for heading, values in sections
+        ]
+
+    def _render_investment_thesis_slide(self, prs, sections):
         """Generate investment thesis slide"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_title_to_slide(slide, "Investment Thesis")
 
-        content_box = slide.shapes.add_textbox(
-            Inches(0.75), Inches(1.05), Inches(9), Inches(5))
+        content_box = slide.shapes.add_textbox(*THESIS_BOX)
         tf = content_box.text_frame
 
-        # Get and format all data
-        financial_health = self.get_financial_health()
-        analyst_insights = self.get_analyst_insights()
-        dividend_info = self.get_dividend_info()
+        for index, (heading, lines) in enumerate(sections):
+            if index > 0:
+                tf.add_paragraph().font.size = SPACING_SIZE  # Spacing
 
-        # Financial Health section
-        p1 = tf.add_paragraph()
-        run1 = p1.add_run()
-        run1.text = "Financial Health:"
-        run1.font.bold = True
-        tf.add_paragraph().font.size = Pt(9)  # Spacing
-
-        for key, value in financial_health.items():
             p = tf.add_paragraph()
-            p.text = f"{key.replace('_', ' ').title()}: {value}"
-
-        tf.add_paragraph().font.size = Pt(9)  # Spacing
-
-        # Analyst Insights section
-        p2 = tf.add_paragraph()
-        run2 = p2.add_run()
-        run2.text = "Analyst Insights:"
-        run2.font.bold = True
-        tf.add_paragraph().font.size = Pt(9)  # Spacing
-
-        for key, value in analyst_insights.items():
-            p = tf.add_paragraph()
-            p.text = f"{key.replace('_', ' ').title()}: {value}"
-
-        tf.add_paragraph().font.size = Pt(9)  # Spacing
-
-        # Dividend Information section
-        p3 = tf.add_paragraph()
-        run3 = p3.add_run()
-        run3.text = "Dividend Information:"
-        run3.font.bold = True
-        tf.add_paragraph().font.size = Pt(9)  # Spacing
+            run = p.add_run()
+            run.text = heading
+            run.font.bold = True
+            tf.add_paragraph().font.size = SPACING_SIZE  # Spacing
 
-        for key, value in dividend_info.items():
-            p = tf.add_paragraph()
-            p.text = f"{key.replace('_', ' ').title()}: {value}"
+            for line in lines:
+                tf.add_paragraph().text = line
 
         apply_white_text_to_slide(slide)
 
-    def _generate_risk_analysis_slide(self, prs):
+    def _prepare_risk_analysis(self):
+        """Collect the risk analysis slide data"""
+        return self.generate_risk_analysis()
+
+    def _render_risk_analysis_slide(self, prs, risk_analysis):
         """Generate risk analysis slide"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_title_to_slide(slide, "Risk Analysis and Mitigation")
 
-        content_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+        content_box = slide.shapes.add_textbox(*CONTENT_BOX)
         tf = content_box.text_frame
 
-        risk_analysis = self.generate_risk_analysis()
-
         # Risks section
         p1 = tf.add_paragraph()
         run1 = p1.add_run()
@@ -644,27 +733,36 @@ The company shows promising potential with strong market positioning and innovat
 
         apply_white_text_to_slide(slide)
 
-    def _generate_conclusion_slide(self, prs):
+    def _prepare_conclusion(self):
+        """Build the recommendation text"""
+        strengths_catalysts = self.strengths_catalysts
+        return self.generate_recommendation(
+            strengths_catalysts['strengths'],
+            strengths_catalysts['catalysts']
+        )
+
+    def _render_conclusion_slide(self, prs, recommendation):
         """Generate conclusion slide"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         self._add_title_to_slide(slide, "Conclusion and Recommendation")
 
-        content_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.5), Inches(9), Inches(5))
+        content_box = slide.shapes.add_textbox(*CONTENT_BOX)
         tf = content_box.text_frame
 
-        strengths_catalysts = self.generate_key_strengths_and_catalysts()
-        recommendation = self.generate_recommendation(
-            strengths_catalysts['strengths'],
-            strengths_catalysts['catalysts']
-        )
-
         p = tf.add_paragraph()
         p.text = recommendation
-        
+
         apply_white_text_to_slide(slide)
 
     def generate_presentation(self):
+            # Download history and render the chart while the data is fetched and other slides are built
+            chart_pool = ThreadPoolExecutor(max_workers=1)
+            chart_future = chart_pool.submit(self.create_stock_price_chart)
+            chart_pool.shutdown(wait=False)
+
+            if hasattr(self, 'stock'):
+                self._prefetch()
+
             prs = Presentation()
 
             # Title slide
@@ -672,49 +770,35 @@ The company shows promising potential with strong market positioning and innovat
             apply_slide_background(slide1)
 
             # Create centered title with gradient
-            left = Inches(1)
-            top = Inches(3)
-            width = Inches(8)
-            height = Inches(1.5)
-
             title_text = f"{self.company_info.get('name', self.ticker)} Stock Analysis"
-            create_gradient_textbox(slide1, left, top, width, height, title_text)
-
-            # Generate content slides - with error handling for each
-            try:
-                self._generate_overview_slide(prs)
-            except Exception as e:
-                print(f"Warning: Error generating overview slide: {e}")
-
-            try:
-                self._generate_market_position_slide(prs)
-            except Exception as e:
-                print(f"Warning: Error generating market position slide: {e}")
-
-            try:
-                self._generate_strengths_catalysts_slide(prs)
-            except Exception as e:
-                print(f"Warning: Error generating strengths slide: {e}")
-
-            try:
-                self._generate_investment_thesis_slide(prs)
-            except Exception as e:
-                print(f"Warning: Error generating investment thesis slide: {e}")
-
-            try:
-                self._generate_risk_analysis_slide(prs)
-            except Exception as e:
-                print(f"Warning: Error generating risk analysis slide: {e}")
-
-            try:
-                self._generate_conclusion_slide(prs)
-            except Exception as e:
-                print(f"Warning: Error generating conclusion slide: {e}")
-
-            # Save presentation
+            create_gradient_textbox(slide1, *COVER_TITLE_BOX, title_text)
+
+            # Content slides as (name, prepare, render)
+            slides = [
+                ('overview', self._prepare_overview,
+                 partial(self._render_overview_slide, chart_future=chart_future)),
+                ('market position', self._prepare_market_position, self._render_market_position_slide),
+                ('strengths', self._prepare_strengths_catalysts, self._render_strengths_catalysts_slide),
+                ('investment thesis', self._prepare_investment_thesis, self._render_investment_thesis_slide),
+                ('risk analysis', self._prepare_risk_analysis, self._render_risk_analysis_slide),
+                ('conclusion', self._prepare_conclusion, self._render_conclusion_slide)
+            ]
+
+            # Slide data is plain Python and is prepared concurrently; python-pptx isn't
+            # thread-safe, so slides are rendered one at a time in order - with error handling for each
+            with ThreadPoolExecutor(max_workers=len(slides)) as executor:
+                prepared = [(name, executor.submit(prepare), render) for name, prepare, render in slides]
+                for name, future, render in prepared:
+                    try:
+                        render(prs, future.result())
+                    except Exception as e:
+                        print(f"Warning: Error generating {name} slide: {e}")
+
+            # Save presentation in the background so a caller can start on the next ticker;
+            # wait on the returned future before using the file
             output_filename = f"{self.ticker}_stock_analysis.pptx"
-            prs.save(output_filename)
-            return output_filename
+            save_future = _SAVE_POOL.submit(prs.save, output_filename)
+            return output_filename, save_future
 
 
 def main():
@@ -722,11 +806,12 @@ def main():
     ticker = input("Enter stock ticker: ")
     generator = StockPresentationGenerator(ticker)
     
-    presentation_path = generator.generate_presentation()
-    if presentation_path:
+    presentation_path, save_future = generator.generate_presentation()
+    try:
+        save_future.result()
         print(f"Presentation generated successfully: {presentation_path}")
-    else:
-        print("Failed to generate presentation")
+    except Exception as e:
+        print(f"Failed to generate presentation: {e}")
     
 
 if __name__ == "__main__":
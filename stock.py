@@ -1,39 +1,161 @@
-from openai import OpenAI
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-import sys
+from lxml import etree, html
 import io
+import json
+import os
+import pickle
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Optional
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from pdf2docx import parse
+from file_cache import FileCache, cached
+from indicators import moving_averages
 
-client = OpenAI(api_key='')
+# Copy-on-Write is always on from pandas 3.0; opt in on 2.x so derived frames stay views until written to
+if pd.__version__.startswith('2.'):
+    pd.options.mode.copy_on_write = True
+
+# matplotlib, openai and python-docx take most of the start-up time, so they are
+# imported by the functions that use them rather than here
+
+@lru_cache(maxsize=None)
+def get_openai_client():
+    """Shared OpenAI client, created on first use"""
+    from openai import OpenAI
+    return OpenAI(api_key='')
 
 headers = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.6668.101 Safari/537.36'
 }
 
+# Shared session so repeated scrapes reuse pooled keep-alive connections instead of a new TLS handshake each time
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                      max_retries=Retry(total=2, backoff_factor=0.3)))
+REQUEST_TIMEOUT = 5
+
+# Payloads fetched for the ticker being processed and its peers, cleared by process_ticker
+# so the next ticker goes back through the TTL'd file_cache instead of reusing old prices
 comparable_yf_fetched_information = {}
 
+# Seconds to wait on any single background network call
+FETCH_TIMEOUT = 15
+# A JSON completion from GPT-4o routinely takes longer than a Yahoo scrape
+NARRATIVE_TIMEOUT = 120
+
+# Shared by every report so a batch run reuses the same worker threads and the
+# connections they keep open in SESSION instead of spinning up a pool per ticker
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8)
+
+# On-disk cache of Yahoo and OpenAI responses so reruns on the same day skip the network
+file_cache = FileCache('.cache')
+NARRATIVE_TTL = timedelta(hours=24)
+DEBT_TO_EQUITY_TTL = timedelta(hours=24)
+
+# yf.Ticker payloads are stored under the same "<TICKER>_<name>" keys presentation.py uses,
+# so either script can reuse what the other downloaded while it is still fresh enough here
+YF_CACHE_TTL = {
+    'info': timedelta(hours=1),
+    'history': timedelta(hours=6),
+    'financials': timedelta(days=90),
+    'income_stmt': timedelta(days=90),
+    'balance_sheet': timedelta(days=90),
+    'news': timedelta(hours=1)
+}
+
+KEY_STATS_URL = 'https://finance.yahoo.com/quote/{ticker}/key-statistics/'
+KEY_STATS_TTL = timedelta(minutes=15)
+
+# Row labels on the key-statistics page for each value we read from it
+KEY_STATS_LABELS = {
+    'pe': 'Trailing P/E',
+    'ev_ebitda': 'Enterprise Value/EBITDA',
+    'ps': 'Price/Sales',
+    'pb': 'Price/Book'
+}
+
+# ticker -> (fetched_at, {stat: raw text or None})
+_stats_cache = {}
+# One lock per ticker so concurrent getters for the same ticker share a single download
+_stats_locks = {}
+
+def _load_key_stats(ticker):
+    """
+    Key-statistics values for a ticker, downloaded at most once per KEY_STATS_TTL
+    """
+    with _stats_locks.setdefault(ticker, threading.Lock()):
+        cached = _stats_cache.get(ticker)
+        if cached and datetime.now() - cached[0] < KEY_STATS_TTL:
+            return cached[1]
+
+        stats = _fetch_key_stats(ticker)
+        _stats_cache[ticker] = (datetime.now(), stats)
+        return stats
+
+@cached(file_cache, KEY_STATS_TTL, should_cache=lambda stats: any(stats.values()))
+def _fetch_key_stats(ticker):
+    """
+    Download the key-statistics page and read price, P/E, EV/EBITDA, P/S and P/B in one pass
+    """
+    response = SESSION.get(KEY_STATS_URL.format(ticker=ticker), timeout=REQUEST_TIMEOUT)
+    stats = dict.fromkeys(KEY_STATS_LABELS)
+    stats['price'] = None
+    if not response.content.strip():
+        return stats
+    # Stream the page one element at a time and stop once every value has been read,
+    # so the rest of the document is never parsed or kept in memory
+    missing = dict(KEY_STATS_LABELS)
+    rows = etree.iterparse(io.BytesIO(response.content), events=('end',),
+                           tag=('tr', 'fin-streamer'), html=True, recover=True)
+    for _, elem in rows:
+        if elem.tag == 'fin-streamer':
+            # Left intact, the element may sit inside a row that hasn't been read yet
+            if stats['price'] is None and elem.get('data-field') == 'regularMarketPrice':
+                stats['price'] = elem.get('data-value')
+            continue
+
+        text = ''.join(elem.itertext())
+        for key, label in list(missing.items()):
+            if label in text:
+                del missing[key]
+                cells = elem.findall('.//td')
+                if len(cells) > 1:
+                    stats[key] = ''.join(cells[1].itertext())
+        elem.clear(keep_tail=True)
+        if not missing and stats['price'] is not None:
+            break
+
+    return stats
+
+def _get_key_stat(ticker, key, display_name):
+    value = _load_key_stats(ticker)[key]
+    if value is None:
+        print(f"Could not find {display_name} for {ticker}")
+        return 0
+    try:
+        return float(value.replace(',', ''))  # Convert to float and handle commas
+    except ValueError:
+        return 0
+
 """Stock Price"""
 def get_stock_price(ticker):
-    url = f'https://finance.yahoo.com/quote/{ticker}/key-statistics/'
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
-    price_element = soup.find('fin-streamer', {'data-field': 'regularMarketPrice'})
-    stock_price = None
-    
-    if price_element:
-        stock_price = price_element.get('data-value')
+    stock_price = _load_key_stats(ticker)['price']
+    if stock_price:
         return float(stock_price)
-    
     return 0
 
 """P/AUM"""
@@ -41,7 +163,7 @@ def get_assets_under_management_ratio(ticker):
     try:
         # strengths = []
         content = f'Only give one word answers, Whats ${ticker} Assets Under management numeric value. Without commas or $ sign.'
-        completion = client.chat.completions.create(
+        completion = get_openai_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {
@@ -69,127 +191,34 @@ def get_assets_under_management_ratio(ticker):
 
 """P/E TTM"""
 def get_trailing_pe(ticker):
-    url = f'https://finance.yahoo.com/quote/{ticker}/key-statistics/'
-
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
-    rows = soup.find_all('tr')
-    pe_value = None
-
-    for row in rows:
-        if 'Trailing P/E' in row.text:
-            pe_value = row.find_all('td')[1].text
-            break
-
-    pe_value_float = 0
-    if pe_value:
-        try:
-            pe_value_float = float(pe_value.replace(',', ''))  # Convert to float and handle commas
-        except ValueError:
-            pe_value_float = 0
-    else:
-        print(f"Could not find Trailing P/E for {ticker}")
-        return 0
-    
-    return pe_value_float
-
-    
+    return _get_key_stat(ticker, 'pe', 'Trailing P/E')
 
 """EV/EBITDA"""
 def get_ev_ebitda(ticker):
-    url = f'https://finance.yahoo.com/quote/{ticker}/key-statistics/'
-
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
-    rows = soup.find_all('tr')
-
-    ev_ebitda_value = None
-
-    for row in rows:
-        if 'Enterprise Value/EBITDA' in row.text:
-            ev_ebitda_value = row.find_all('td')[1].text
-            break
-
-    # Check if the value is found
-    ev_ebitda_value_float = 0
-    if ev_ebitda_value:
-        try:
-            ev_ebitda_value_float = float(ev_ebitda_value.replace(',', ''))  # Convert to float and handle commas
-        except ValueError:
-            ev_ebitda_value_float = 0
-    else :
-        print(f"Could not find EV/EBITA for {ticker}")
-        return 0
-
-    return ev_ebitda_value_float
-    
+    return _get_key_stat(ticker, 'ev_ebitda', 'EV/EBITA')
 
 """P/S TTM"""
 def get_price_sales(ticker):
-    url = f'https://finance.yahoo.com/quote/{ticker}/key-statistics/'
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
-    rows = soup.find_all('tr')
+    return _get_key_stat(ticker, 'ps', 'P/S TTM')
 
-    ps_value = None
-
-    for row in rows:
-        if 'Price/Sales' in row.text:
-            ps_value = row.find_all('td')[1].text
-            break
-
-    ps_value_float=0
-    if ps_value:
-        try:
-            ps_value_float = float(ps_value.replace(',', ''))  # Convert to float and handle commas
-        except ValueError:
-            ps_value_float = 0
-    else:
-        print(f"Could not find P/S TTM for {ticker}")
-        return 0
-    
-    return ps_value_float
-
-# Function to extract Price/Book for a given ticker
 """P/NAV OR P/B TTM"""
 def get_price_book(ticker):
-    url = f'https://finance.yahoo.com/quote/{ticker}/key-statistics/'
-
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
-    rows = soup.find_all('tr')
-
-    pb_value = None
-
-    for row in rows:
-        if 'Price/Book' in row.text:
-            pb_value = row.find_all('td')[1].text
-            break
-
-    if pb_value:
-        try:
-            pb_value_float = float(pb_value.replace(',', ''))  # Convert to float and handle commas
-        except ValueError:
-            pb_value_float = 0
-    else:
-        print(f"Could not find P/NAV for {ticker}")
-        return 0
-    
-    return pb_value_float   
-
+    return _get_key_stat(ticker, 'pb', 'P/NAV')
 
+# Debt to equity only moves with quarterly filings, so overlapping peer lists reuse the copy on disk
+@cached(file_cache, DEBT_TO_EQUITY_TTL)
 def get_debt_to_equity(ticker):
     url = f"https://ycharts.com/companies/{ticker}"
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    debt_equity_link = soup.find('a', string='Debt to Equity Ratio')
-    if debt_equity_link:
-        td = debt_equity_link.find_parent('td')
-        value_td = td.find_next('td', class_='text-right')
-        if value_td:
-            value = float(value_td.text.strip())
-            # print("For ",ticker,":",float(value_td.text.strip()))
-            return value if value > 0 else 0
+    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    if not response.content.strip():
+        return 0
+    tree = html.fromstring(response.content)
+    value_td = tree.xpath(
+        "(//a[text()='Debt to Equity Ratio']/ancestor::td[1]"
+        "/following::td[contains(concat(' ', normalize-space(@class), ' '), ' text-right ')])[1]")
+    if value_td:
+        value = float(value_td[0].text_content().strip())
+        return value if value > 0 else 0
     return 0
 
 """Price to FFO"""
@@ -212,35 +241,132 @@ def get_pffo(ticker):
                 gain_on_sale = 0
                 
             total = net_income + reconciled_depreciation + gain_on_sale
-            FFO_per_share = total / shares_count if shares_count != 0 else None
-            P_FFO = price / FFO_per_share if FFO_per_share and FFO_per_share != 0 else None
-
-            return P_FFO 
+            # 0 marks the value as unavailable, same as the other metric getters
+            if not shares_count or not total:
+                return 0
+            FFO_per_share = total / shares_count
+            return price / FFO_per_share
         return 0
-    except:
+    except Exception:
         return 0
 
+def fetch_yf(ticker, name, loader):
+    """A yf.Ticker payload, served from .cache/ while it is younger than YF_CACHE_TTL[name]"""
+    key = f"{ticker}_{name}"
+    value = file_cache.get(key, YF_CACHE_TTL[name])
+    if value is None:
+        value = loader()
+        # Don't persist empty responses, Yahoo returns those when throttling
+        is_empty = value.empty if isinstance(value, pd.DataFrame) else not value
+        if not is_empty:
+            file_cache.set(key, value)
+    return value
+
+def _get_ticker_info(ticker):
+    """yf.Ticker(ticker).info, cached on disk for YF_CACHE_TTL['info'] so prices don't go stale between reports"""
+    return fetch_yf(ticker, 'info', lambda: yf.Ticker(ticker).info)
+
+def get_stock_info(ticker):
+    """Info dict for a ticker, reusing what main() already fetched when possible"""
+    fetched = comparable_yf_fetched_information.get(ticker)
+    if fetched is not None:
+        return fetched['info']
+    return _get_ticker_info(ticker)
+
 """Dividend Yield"""
-# Loop through each ticker symbol in the list
 def get_divident_yield(ticker):
-        info = comparable_yf_fetched_information[ticker]['info']
-
-        # Get the Forward Dividend Yield information
-        dividend_yield = info.get("dividendYield")  # As a decimal (e.g., 0.05 for 5%)
-
-        # Display the Forward Dividend Yield in the specified format
-        if dividend_yield:
-            yield_percentage = dividend_yield * 100
-        else:
-            print(f"Could not find DY for {ticker}")
-            return 0
-        
-        return yield_percentage
-
+    # Get the Forward Dividend Yield information
+    dividend_yield = get_stock_info(ticker).get("dividendYield")  # As a decimal (e.g., 0.05 for 5%)
 
+    if not dividend_yield:
+        print(f"Could not find DY for {ticker}")
+        return 0
 
-def convert_pdf2docx(input_file: str, output_file: str):
-    parse(input_file, output_file)
+    return dividend_yield * 100
+
+
+
+def _docx_rgb(color):
+    from docx.shared import RGBColor
+    return RGBColor(*(round(c * 255) for c in colors.toColor(color).rgb()))
+
+def _docx_shade(cell, color):
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    shading = OxmlElement('w:shd')
+    shading.set(qn('w:val'), 'clear')
+    shading.set(qn('w:fill'), str(_docx_rgb(color)))
+    cell._tc.get_or_add_tcPr().append(shading)
+
+def _docx_paragraph(container, paragraph):
+    """Copy a ReportLab Paragraph, keeping the bold, size and colour of each run of text"""
+    from docx.shared import Pt
+    docx_paragraph = container.add_paragraph()
+    docx_paragraph.paragraph_format.space_before = Pt(paragraph.style.spaceBefore)
+    docx_paragraph.paragraph_format.space_after = Pt(paragraph.style.spaceAfter)
+    # Laying the PDF out rewrites frags into per-line word lists, so work from a fresh parse of the markup
+    for frag in Paragraph(paragraph.text, paragraph.style).frags:
+        run = docx_paragraph.add_run(getattr(frag, 'text', ''))
+        run.bold = bool(frag.bold)
+        run.font.size = Pt(frag.fontSize)
+        run.font.color.rgb = _docx_rgb(frag.textColor)
+
+def _docx_table(container, table):
+    """Copy a ReportLab Table cell by cell, nesting the flowables of layout cells"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
+    rows = table._cellvalues
+    docx_table = container.add_table(len(rows), len(rows[0]))
+    if table._linecmds:
+        docx_table.style = 'Table Grid'
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            cell = docx_table.cell(r, c)
+            # _argW is the colWidths passed in; _colWidths is recomputed while the PDF is laid out
+            if isinstance(table._argW[c], (int, float)):
+                cell.width = Pt(table._argW[c])
+            if isinstance(value, str):
+                cell_style = table._cellStyles[r][c]
+                paragraph = cell.paragraphs[0]
+                paragraph.alignment = getattr(WD_ALIGN_PARAGRAPH, cell_style.alignment.upper(), None)
+                run = paragraph.add_run(value)
+                run.bold = 'Bold' in cell_style.fontname
+                run.font.size = Pt(cell_style.fontsize)
+                run.font.color.rgb = _docx_rgb(cell_style.color)
+                if cell_style.background not in (None, 'white', colors.white):
+                    _docx_shade(cell, cell_style.background)
+            else:
+                # Word needs a paragraph in every cell, so the placeholder one goes only once something replaces it
+                placeholder = cell.paragraphs[0]._element
+                _docx_flowables(cell, value if isinstance(value, (list, tuple)) else [value])
+                if len(cell.paragraphs) > 1 or cell.tables:
+                    cell._tc.remove(placeholder)
+
+def _docx_flowables(container, flowables):
+    from docx.shared import Pt
+    for flowable in flowables:
+        if isinstance(flowable, Paragraph):
+            _docx_paragraph(container, flowable)
+        elif isinstance(flowable, Table):
+            _docx_table(container, flowable)
+        elif isinstance(flowable, Image):
+            # Image hands its buffer to an ImageReader on first use; getvalue() leaves the PDF's read position alone
+            picture = io.BytesIO(flowable._img.fileName.getvalue())
+            container.add_paragraph().add_run().add_picture(picture, width=Pt(flowable.drawWidth), height=Pt(flowable.drawHeight))
+        # Spacers have no content to copy
+
+def story_to_docx(story, docx_name):
+    """Write the report story straight to a Word document, laid out like the PDF"""
+    from docx import Document
+    from docx.shared import Pt
+    document = Document()
+    section = document.sections[0]
+    section.page_width, section.page_height = Pt(letter[0]), Pt(letter[1])
+    section.left_margin, section.right_margin, section.top_margin, section.bottom_margin = map(Pt, REPORT_MARGINS)
+    document.styles['Normal'].font.name = 'Arial'
+    _docx_flowables(document, story)
+    document.save(docx_name)
+    print(f"Word report saved as: {docx_name}")
 
 def format_market_value(value):
     if value is None:
@@ -256,253 +382,270 @@ def format_date(date):
         if not isinstance(date, datetime):
             date = datetime.fromtimestamp(date)
         return date.strftime('%d-%m-%Y')
-    except:
+    except (TypeError, ValueError, OverflowError, OSError):
         return "Not available"
 
-def get_company_info(stock_info):
-    try:
-        print("\nCOMPANY OVERVIEW")
-        print(f"Company Name: {stock_info.get('longName', 'Not available')}")
-        print(f"Industry: {stock_info.get('industry', 'Not available')}")
-        print(f"Sector: {stock_info.get('sector', 'Not available')}")
+@dataclass
+class CompanyOverview:
+    name: str
+    industry: str
+    sector: str
+    description: Optional[str] = None
+
+@dataclass
+class BusinessDetails:
+    market_cap: Optional[float] = None
+    shares_outstanding: Optional[float] = None
+    float_shares: Optional[float] = None
+
+@dataclass
+class InvestmentThesis:
+    debt_to_equity: float
+    total_cash: Optional[float] = None
+    total_debt: Optional[float] = None
+    current_ratio: Optional[float] = None
+    analyst_rating: Optional[float] = None
+    recommendation: Optional[str] = None
+    analyst_count: Optional[int] = None
+    target_price: Optional[float] = None
+    upside: Optional[float] = None
+
+@dataclass
+class UpcomingEvents:
+    earnings_date: Optional[str] = None
+    ex_dividend_date: Optional[str] = None
+    dividend_rate: Optional[float] = None
+    dividend_yield: Optional[float] = None
 
-        if stock_info.get('longBusinessSummary'):
-            sentences = stock_info['longBusinessSummary'].split('. ')
-            summary = '. '.join(sentences[:3]) + '.'
-            print("\nBusiness Description:")
-            print(summary)
+def get_company_info(stock_info):
+    summary = None
+    if stock_info.get('longBusinessSummary'):
+        sentences = stock_info['longBusinessSummary'].split('. ')
+        summary = '. '.join(sentences[:3]) + '.'
 
-    except Exception as e:
-        print(f"Error getting company info: {e}")
+    return CompanyOverview(
+        name=stock_info.get('longName', 'Not available'),
+        industry=stock_info.get('industry', 'Not available'),
+        sector=stock_info.get('sector', 'Not available'),
+        description=summary
+    )
 
 
 def get_business_details(stock_info):
-    try:
-        print("\nBUSINESS AND MARKET POSITION")
-        if stock_info.get('marketCap'):
-            print("\nMarket Position:")
-            print(f"• Market Cap: ${stock_info['marketCap']/1e9:.1f}B")
-        if stock_info.get('sharesOutstanding'):
-            print(f"• Shares Outstanding: {stock_info['sharesOutstanding']/1e6:.1f}M")
-        if stock_info.get('floatShares'):
-            print(f"• Float: {stock_info['floatShares']/1e6:.1f}M")
-
-        print("\nKey Statistics:")
-
-    except Exception as e:
-        print(f"Error getting business details: {e}")
-
-def get_investment_thesis(ticker, stock_info):
-    try:
-        de = get_debt_to_equity(ticker)
-        print("\nINVESTMENT THESIS")
-
-        print("\nFinancial Health:")
-        if stock_info.get('totalCash'):
-            print(f"• Cash Position: ${stock_info['totalCash']/1e9:.1f}B")
-        if stock_info.get('totalDebt'):
-            print(f"• Total Debt: ${stock_info['totalDebt']/1e9:.1f}B")
-        # if stock_info.get('debtToEquity'):
-        # print(f"• Debt to Equity: {stock_info['debtToEquity']:.2f}")
-        print(f"• Debt to Equity: {de}")
-        if stock_info.get('currentRatio'):
-            if(stock_info.get('currentRatio') < 1):
-                print(f"• Current Ratio: {stock_info['currentRatio']:.2f}")
-            else :
-                print(f"• Current Ratio: {stock_info['currentRatio']:.1f}")
-
-
-        print("\nAnalyst Insights:")
-        if stock_info.get('recommendationMean'):
-            print(f"• Analyst Rating (1-5): {stock_info['recommendationMean']:.1f}")
-        if stock_info.get('recommendationKey'):
-            print(f"• Recommendation: {stock_info['recommendationKey'].upper()}")
-        if stock_info.get('numberOfAnalystOpinions'):
-            print(f"• Number of Analysts: {stock_info['numberOfAnalystOpinions']}")
-        if stock_info.get('targetMeanPrice'):
-            print(f"• Mean Target Price: ${stock_info['targetMeanPrice']:.1f}")
-            current_price = stock_info.get('currentPrice', stock_info.get('regularMarketPrice'))
-            if current_price:
-                upside = ((stock_info['targetMeanPrice'] / current_price) - 1) * 100
-                print(f"• Implied +/-: {upside:.1f}%")
-
-    except Exception as e:
-        print(f"Error getting investment thesis: {e}")
+    return BusinessDetails(
+        market_cap=stock_info.get('marketCap'),
+        shares_outstanding=stock_info.get('sharesOutstanding'),
+        float_shares=stock_info.get('floatShares')
+    )
+
+def get_investment_thesis(stock_info, de):
+    upside = None
+    current_price = stock_info.get('currentPrice', stock_info.get('regularMarketPrice'))
+    if stock_info.get('targetMeanPrice') and current_price:
+        upside = ((stock_info['targetMeanPrice'] / current_price) - 1) * 100
+
+    return InvestmentThesis(
+        debt_to_equity=de,
+        total_cash=stock_info.get('totalCash'),
+        total_debt=stock_info.get('totalDebt'),
+        current_ratio=stock_info.get('currentRatio'),
+        analyst_rating=stock_info.get('recommendationMean'),
+        recommendation=stock_info.get('recommendationKey'),
+        analyst_count=stock_info.get('numberOfAnalystOpinions'),
+        target_price=stock_info.get('targetMeanPrice'),
+        upside=upside
+    )
+
+def get_upcoming_events(stock_info):
+    events = UpcomingEvents()
+    earnings_dates = stock_info.get('earningsDate')
+    if isinstance(earnings_dates, list) and len(earnings_dates) > 0:
+        events.earnings_date = format_date(earnings_dates[0])
+    if stock_info.get('exDividendDate'):
+        events.ex_dividend_date = format_date(stock_info['exDividendDate'])
+        events.dividend_rate = stock_info.get('dividendRate')
+        events.dividend_yield = stock_info.get('dividendYield')
+    return events
+
+# Columns of the financial table, in display order
+FINANCIAL_COLUMNS = ['Revenue', 'EBIT', 'Net Profit', 'EBITDA', 'ROI']
 
 def create_financial_table(income_stmt, balance_sheet):
     try:
         if income_stmt is not None and not income_stmt.empty:
-            financial_data = pd.DataFrame()
-
-            def convert_to_millions(x):
-                try:
-                    return float(x) / 1_000_000
-                except:
-                    return float('nan')
-
-            try:
-                financial_data['Revenue'] = income_stmt.loc['Total Revenue'].apply(convert_to_millions)
-            except:
-                try:
-                    financial_data['Revenue'] = income_stmt.loc['Revenue'].apply(convert_to_millions)
-                except:
-                    financial_data['Revenue'] = float('nan')
-
-            try:
-                financial_data['EBIT'] = income_stmt.loc['Operating Income'].apply(convert_to_millions)
-            except:
-                try:
-                    financial_data['EBIT'] = income_stmt.loc['EBIT'].apply(convert_to_millions)
-                except:
-                    financial_data['EBIT'] = float('nan')
-
-            try:
-                financial_data['Net Profit'] = income_stmt.loc['Net Income'].apply(convert_to_millions)
-            except:
-                try:
-                    financial_data['Net Profit'] = income_stmt.loc['Net Income Common Stockholders'].apply(convert_to_millions)
-                except:
-                    financial_data['Net Profit'] = float('nan')
-
-            try:
-                ebit = income_stmt.loc['Operating Income']
-                try:
-                    depreciation = income_stmt.loc['Depreciation & Amortization']
-                except:
-                    depreciation = income_stmt.loc['Depreciation And Amortization']
-
-                financial_data['EBITDA'] = (ebit + depreciation).apply(convert_to_millions)
-            except:
-                try:
-                    financial_data['EBITDA'] = income_stmt.loc['EBITDA'].apply(convert_to_millions)
-                except:
-                    financial_data['EBITDA'] = float('nan')
-
-            try:
-                net_profit = income_stmt.loc['Net Income']
-                total_assets = balance_sheet.loc['Total Assets']
-                roi = (net_profit / total_assets) * 100
-                financial_data['ROI'] = roi.apply(lambda x: f"{x:.2f}%")
-            except:
+            # Columns are built as float64 arrays aligned with the statement's years
+            financial_data = {}
+
+            def row_in_millions(statement, *labels):
+                """First of labels present in the statement as a float64 array in millions, else None"""
+                for label in labels:
+                    if statement is not None and label in statement.index:
+                        values = statement.loc[label].reindex(income_stmt.columns)
+                        return pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64') / 1e6
+                return None
+
+            def or_nan(values):
+                return np.nan if values is None else values
+
+            financial_data['Revenue'] = or_nan(row_in_millions(income_stmt, 'Total Revenue', 'Revenue'))
+            financial_data['EBIT'] = or_nan(row_in_millions(income_stmt, 'Operating Income', 'EBIT'))
+            financial_data['Net Profit'] = or_nan(row_in_millions(income_stmt, 'Net Income', 'Net Income Common Stockholders'))
+
+            ebit = row_in_millions(income_stmt, 'Operating Income')
+            depreciation = row_in_millions(income_stmt, 'Depreciation & Amortization', 'Depreciation And Amortization')
+            if ebit is not None and depreciation is not None:
+                financial_data['EBITDA'] = ebit + depreciation
+            else:
+                financial_data['EBITDA'] = or_nan(row_in_millions(income_stmt, 'EBITDA'))
+
+            net_profit = row_in_millions(income_stmt, 'Net Income')
+            total_assets = row_in_millions(balance_sheet, 'Total Assets')
+            if net_profit is not None and total_assets is not None:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    roi = (net_profit / total_assets) * 100
+                financial_data['ROI'] = np.char.mod('%.2f%%', roi)
+            else:
                 financial_data['ROI'] = "N/A"
 
-            financial_data.index = financial_data.index.year
+            financial_data = pd.DataFrame(financial_data, index=income_stmt.columns.year)
             financial_data = financial_data.sort_index(ascending=False)
 
-            pd.set_option('display.float_format', lambda x: '{:,.0f}'.format(x))
-
             print("\nFINANCIAL TABLE (in millions USD)")
 
-            print(financial_data.fillna('N/A'))
+            with pd.option_context('display.float_format', '{:,.0f}'.format):
+                print(financial_data.fillna('N/A'))
 
             return financial_data
 
     except Exception as e:
         print(f"Error creating financial table: {e}")
-        return None
 
-def get_risk_analysis(ticker):
-    try:
-        print("\nRISK ANALYSIS AND MITIGATION")
-        content = f'What are the top 2 risks and mitigations for ${ticker} stock? Provide two-liner explanation of the point as well. Use - at the start of each line. Dont bold anything anywhere.'
-        completion = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                   "role": "user",
-                    "content": [
-                        {
-                            "type":"text",
-                            "text":content
-                        }
-                    ]
-                }
-            ]
-        )
-        print(completion.choices[0].message.content)
+    return pd.DataFrame(columns=FINANCIAL_COLUMNS)
 
-    except Exception as e:
-        print(f"Error generating risk analysis: {e}")
+def financial_table_rows(financial_data):
+    """Header row plus one formatted row per year, in the layout the PDF table expects"""
+    def format_cell(value):
+        if isinstance(value, str):
+            return value
+        return 'N/A' if pd.isna(value) else f"{value:,.0f}"
 
-def get_stock_strengths(ticker):
-    try:
-        print("\nKEY STRENGTHS")
-        content = f'${ticker}stock and company strengths(top 3)? Provide one-line explanation of the point as well. Use - at the start of each line. dont use bold anywhere.'
-        completion = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                   "role": "user",
-                    "content": [
-                        {
-                            "type":"text",
-                            "text":content
-                        }
-                    ]
-                }
-            ]
-        )
-        print(completion.choices[0].message.content)
-       
-    except Exception as e:
-        print("Error analyzing strengths:", e)
+    rows = [['Year', *financial_data.columns]]
+    for year, values in zip(financial_data.index, financial_data.itertuples(index=False)):
+        rows.append([str(year), *map(format_cell, values)])
+    return rows
 
-def get_stock_catalysts(ticker):
-    try:
-        print("\nGROWTH CATALYSTS")
-        # strengths = []
-        content = f'${ticker}stock and company growth catalysts(top 3)? Provide one-line explanation of the point as well. Use - at the start of each line. dont use bold anywhere.'
-        completion = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                   "role": "user",
-                    "content": [
-                        {
-                            "type":"text",
-                            "text":content
-                        }
-                    ]
-                }
-            ]
-        )
-        print(completion.choices[0].message.content)
+NARRATIVE_SECTIONS = ('strengths', 'catalysts', 'risks')
 
-    except Exception as e:
-        print("Error analyzing catalysts:", e)
+@cached(file_cache, NARRATIVE_TTL, should_cache=lambda narrative: any(narrative.values()))
+def get_stock_narrative(ticker):
+    """
+    Strengths, growth catalysts and risks for a ticker from a single GPT request
+    Returns a dict mapping each of NARRATIVE_SECTIONS to a list of '- ' prefixed lines
+    """
+    content = (
+        f'For ${ticker} stock and company, return a JSON object with three keys. '
+        '"strengths": the top 3 stock and company strengths, each with a one-line explanation. '
+        '"catalysts": the top 3 growth catalysts, each with a one-line explanation. '
+        '"risks": the top 2 risks and mitigations, each with a two-liner explanation. '
+        'Each key maps to a list of strings, one string per point. Dont bold anything anywhere.'
+    )
+    completion = get_openai_client().chat.completions.create(
+        model="gpt-4o",
+        response_format={"type": "json_object"},
+        messages=[
+            {
+               "role": "user",
+                "content": [
+                    {
+                        "type":"text",
+                        "text":content
+                    }
+                ]
+            }
+        ]
+    )
+    narrative = json.loads(completion.choices[0].message.content)
+    return {section: _narrative_lines(narrative.get(section, [])) for section in NARRATIVE_SECTIONS}
 
+def _narrative_lines(points):
+    """
+    '- ' prefixed lines for one narrative section
+    json_object mode doesn't enforce the requested shape, so a bare string counts as a single point,
+    a {"point": ..., "explanation": ...} object is joined into one line and anything else is skipped
+    """
+    if isinstance(points, (str, dict)):
+        points = [points]
+    elif not isinstance(points, list):
+        return []
+
+    lines = []
+    for point in points:
+        if isinstance(point, dict):
+            point = ': '.join(str(value).strip() for value in point.values() if str(value).strip())
+        if not isinstance(point, str):
+            continue
+        point = point.strip().lstrip('-').strip()
+        if point:
+            lines.append(f"- {point}")
+    return lines
+
+
+# Color for each comparison outcome: better, about the same, worse, no data
+METRIC_COLORS = ('#008000', '#FFA500', '#FF0000', '#000000')  # green, orange, red, black
+
+def get_metric_colors(metric_names, stock_values, comparable_values):
+    """
+    Determine the colors for all metrics at once based on comparison with comparable companies
+    Returns a list of hex color values
+    """
+    stock = np.array(stock_values, dtype=float)
+    peer = np.array(comparable_values, dtype=float)
+    higher_is_better = np.array([name == "Dividend Yield" for name in metric_names], dtype=bool)
 
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentage_diff = ((stock - peer) / peer) * 100
 
+    # Higher dividend yield is better, lower values are better for other metrics
+    higher_index = np.select([percentage_diff > 10, percentage_diff >= -10], [0, 1], 2)
+    lower_index = np.select([percentage_diff < 0, percentage_diff <= 10], [0, 1], 2)
+    color_index = np.where((stock == 0) | (peer == 0), 3,
+                           np.where(higher_is_better, higher_index, lower_index))
+    return [METRIC_COLORS[index] for index in color_index]
 
-def get_metric_color(metric_name, stock_value, comparable_value):
+def get_ratio_color(metric_name, stock_value, comparable_value):
     """
-    Determine the color for a metric based on comparison with comparable companies
+    Determine color for financial ratios (Debt/Equity, Current Ratio, Implied Upside)
     Returns hex color value
     """
     if stock_value == 0 or comparable_value == 0:
         return '#000000'  # black
-    
+
     percentage_diff = ((stock_value - comparable_value) / comparable_value) * 100
-    
-    if metric_name == "Dividend Yield":
-        # Higher dividend yield is better
+
+    if metric_name == "Implied +/-":
+        # Higher upside is better
         if percentage_diff > 10:
             return '#008000'  # green
         elif percentage_diff >= -10:
             return '#FFA500'  # orange
         else:
             return '#FF0000'  # red
-        
-    elif metric_name == 'PricePrice-to-FFO':
-        if percentage_diff < -10:
+    elif metric_name == "Current Ratio":
+        if 15 <= stock_value:
             return '#008000'  # green
-        elif 10 > percentage_diff >= -10:
+        elif 0.0 <= stock_value < 15:
+            return '#FFA500'  # orange
+        else:
+            return '#FF0000'  # red
+    elif metric_name == 'P/AUM':
+        if(percentage_diff < 0):
+            return '#008000'  # orange    
+        elif 0 < percentage_diff < 10:
             return '#FFA500'  # orange
-        if percentage_diff > 10 :
+        else :
             return '#FF0000'  # red
-    else:
-        # Lower values are better for other metrics
-        if percentage_diff < 0:
+    else:  # Debt/Equity
+        if percentage_diff < -10:
             return '#008000'  # green
         elif percentage_diff <= 10:
             return '#FFA500'  # orange
@@ -519,441 +662,323 @@ def format_metric_value(metric_name, value):
     # else:
         # return f"{value:.2f}"
 
+# Metric name as used in 35stocks.xlsx -> getter taking a ticker
+METRIC_GETTERS = {
+    "EV/EBITDA": get_ev_ebitda,
+    "P/E TTM": get_trailing_pe,
+    "P/NAV": get_price_book,
+    "Dividend Yield": get_divident_yield,
+    "P/S TTM": get_price_sales,
+    "P/AUM": get_assets_under_management_ratio,
+    "Price-to-FFO": get_pffo
+}
+
+def _no_metric(ticker):
+    return 0
+
 def get_metric_value(ticker, metric_name):
     """
     Get metric value from Yahoo Finance
     """
-    if ticker == 'PRIVATE' or ticker == 'Private' or ticker.lower() == 'private':
+    if ticker.lower() == 'private':
         return 0
-    else :
-        if metric_name == "EV/EBITDA":
-            return get_ev_ebitda(ticker)
-        elif metric_name == "P/E TTM":
-            return get_trailing_pe(ticker)
-        elif metric_name == "P/NAV":
-            return get_price_book(ticker)
-        elif metric_name == "Dividend Yield":
-            return get_divident_yield(ticker)
-        elif metric_name == "P/S TTM":
-            return get_price_sales(ticker)
-        elif metric_name == 'P/AUM':
-            return get_assets_under_management_ratio(ticker)
-        elif metric_name == 'Price-to-FFO':
-            return get_pffo(ticker)
-        else :
-            return 0
+    return METRIC_GETTERS.get(metric_name, _no_metric)(ticker)
+
+# Left, right, top and bottom page margins in points, shared by the PDF and Word reports
+REPORT_MARGINS = (15, 10, 10, 10)
+
+# Report styles are immutable, so they are built once at import instead of on every report
+_base_style = getSampleStyleSheet()['Normal']
+NORMAL_STYLE = ParagraphStyle('CustomNormal', parent=_base_style, fontSize=9, spaceAfter=4, spaceBefore=4, fontName='Helvetica', leading=11)
+HEADING_STYLE = ParagraphStyle('CustomHeading', parent=_base_style, fontSize=10, fontName='Helvetica-Bold', textColor=colors.maroon, spaceAfter=4, spaceBefore=8, leading=12)
+BOLD_STYLE = ParagraphStyle('CustomBold', parent=_base_style, fontSize=9, spaceAfter=4, spaceBefore=4, fontName='Helvetica-Bold', leading=11)
+FINANCIAL_TABLE_STYLE = TableStyle([
+    ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.maroon),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('BOX', (0, 0), (-1, -1), 1, colors.black),
+    ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ROWPADDING', (0, 0), (-1, -1), 4)
+])
+
+# Padding for the columns of the two-column layout
+LEFT_COLUMN_STYLE = TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -15),
+                                ('RIGHTPADDING', (0, 0), (-1, -1), 10)])
+RIGHT_COLUMN_STYLE = TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0),
+                                 ('RIGHTPADDING', (0, 0), (-1, -1), 10)])
+INSET_COLUMN_STYLE = TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -5),
+                                 ('RIGHTPADDING', (0, 0), (-1, -1), 10)])
+CHART_COLUMN_STYLE = TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0),
+                                 ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+                                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                                 ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')])
+# Outer table that places two columns next to each other
+SIDE_BY_SIDE_STYLE = TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                                 ('LEFTPADDING', (0, 0), (-1, -1), 10),
+                                 ('RIGHTPADDING', (0, 0), (-1, -1), 10)])
+
+_chart_figure = None
+_chart_lock = threading.Lock()
+
+def get_chart_figure():
+    """Return the shared (Figure, Axes) pair used for the report's price chart"""
+    global _chart_figure
+    if _chart_figure is None:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(4, 3))
+        _chart_figure = (fig, fig.add_subplot())
+    return _chart_figure
+
+def _collect(future, default, description, timeout=FETCH_TIMEOUT):
+    """Wait for a background fetch, falling back to default if it fails or takes too long"""
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        # Don't hold up later reports on a call that never started
+        future.cancel()
+        print(f"Timed out {description}")
+    except requests.RequestException as e:
+        print(f"Network error {description}: {e}")
+    except Exception as e:
+        print(f"Error {description}: {e}")
+    return default
 
 def create_pdf_report(ticker, all_content, final_metrics, comparable_metrics, comparable_debt_equity, comparable_current_ratio, comparable_upside):
     try:
+        # Every Yahoo scrape and GPT call below is independent, so run them all at once
+        narrative_future = _FETCH_POOL.submit(get_stock_narrative, ticker)
+        de_future = _FETCH_POOL.submit(get_debt_to_equity, ticker)
+        metric_futures = [_FETCH_POOL.submit(get_metric_value, ticker, metric) for metric in final_metrics]
+
+        narrative = _collect(narrative_future, dict.fromkeys(NARRATIVE_SECTIONS, []), "generating stock narrative",
+                             timeout=NARRATIVE_TIMEOUT)
+        stock_de = _collect(de_future, 0, "fetching debt to equity")
+        stock_metric_values = [_collect(future, 0, f"fetching {metric}")
+                               for metric, future in zip(final_metrics, metric_futures)]
+
         filename = f"{ticker}_Analysis_{datetime.now().strftime('%Y%m%d')}.pdf"
-        margins = (15, 10, 10, 10)
-        doc = SimpleDocTemplate(filename, pagesize=letter, leftMargin=margins[0], rightMargin=margins[1], topMargin=margins[2], bottomMargin=margins[3])
-        styles = getSampleStyleSheet()
-        story = []
-        normal_style = ParagraphStyle('CustomNormal', parent=styles['Normal'], fontSize=9, spaceAfter=4, spaceBefore=4, fontName='Helvetica', leading=11)
-        heading_style = ParagraphStyle('CustomHeading', parent=styles['Normal'], fontSize=10, fontName='Helvetica-Bold', textColor=colors.maroon, spaceAfter=4, spaceBefore=8, leading=12)
-        bold_style = ParagraphStyle('CustomBold', parent=styles['Normal'], fontSize=9, spaceAfter=4, spaceBefore=4, fontName='Helvetica-Bold', leading=11)
-
-        def get_ratio_color(metric_name, stock_value, comparable_value):
-            """
-            Determine color for financial ratios (Debt/Equity, Current Ratio, Implied Upside)
-            Returns hex color value
-            """
-            if stock_value == 0 or comparable_value == 0:
-                return '#000000'  # black
-            
-            percentage_diff = ((stock_value - comparable_value) / comparable_value) * 100
-            
-            if metric_name == "Implied +/-":
-                # Higher upside is better
-                if percentage_diff > 10:
-                    return '#008000'  # green
-                elif percentage_diff >= -10:
-                    return '#FFA500'  # orange
-                else:
-                    return '#FF0000'  # red
-            elif metric_name == "Current Ratio":
-                if 15 <= stock_value:
-                    return '#008000'  # green
-                elif 0.0 <= stock_value < 15:
-                    return '#FFA500'  # orange
-                else:
-                    return '#FF0000'  # red
-            elif metric_name == 'P/AUM':
-                if(percentage_diff < 0):
-                    return '#008000'  # orange    
-                elif 0 < percentage_diff < 10:
-                    return '#FFA500'  # orange
-                else :
-                    return '#FF0000'  # red
-            else:  # Debt/Equity
-                if percentage_diff < -10:
-                    return '#008000'  # green
-                elif percentage_diff <= 10:
-                    return '#FFA500'  # orange
-                else:
-                    return '#FF0000'  # red
-
-        # Capture different sections
-        overview_output = io.StringIO()
-        sys.stdout = overview_output
-        get_company_info(all_content['info'])
-        overview_content = overview_output.getvalue()
-
-        business_output = io.StringIO()
-        sys.stdout = business_output
-        get_business_details(all_content['info'])
-        business_content = business_output.getvalue()
-
-        financial_output = io.StringIO()
-        sys.stdout = financial_output
-        create_financial_table(all_content['income_stmt'], all_content['balance_sheet'])
-        financial_content = financial_output.getvalue()
-
-        strengths_output = io.StringIO()
-        sys.stdout = strengths_output
-        get_stock_strengths(ticker)
-        strengths_content = strengths_output.getvalue()
-
-        catalysts_output = io.StringIO()
-        sys.stdout = catalysts_output
-        get_stock_catalysts(ticker)
-        catalysts_content = catalysts_output.getvalue()
-
-        analysis_output = io.StringIO()
-        sys.stdout = analysis_output
-        get_investment_thesis(ticker,all_content['info'])
-        get_risk_analysis(ticker)
-        analysis_content = analysis_output.getvalue()
-
-        events_output = io.StringIO()
-        sys.stdout = events_output
-        if all_content['info'].get('earningsDate'):
-            print("\nUPCOMING EVENTS")
-            if isinstance(all_content['info']['earningsDate'], list) and len(all_content['info']['earningsDate']) > 0:
-                earnings_date = format_date(all_content['info']['earningsDate'][0])
-                print(f"Next Earnings Date: {earnings_date}")
-        if all_content['info'].get('exDividendDate'):
-            div_date = format_date(all_content['info']['exDividendDate'])
-            print(f"Ex-Dividend Date: {div_date}")
-            if all_content['info'].get('dividendRate'):
-                print(f"Dividend Rate: ${all_content['info']['dividendRate']:.2f}")
-            if all_content['info'].get('dividendYield'):
-                print(f"Dividend Yield: {all_content['info']['dividendYield']*100:.2f}%")
-        events_content = events_output.getvalue()
-
-        sys.stdout = sys.__stdout__
-
-        def process_section(content, story, bullets=False):
-            lines = content.split('\n')
-            headers = ["COMPANY OVERVIEW", "BUSINESS AND MARKET POSITION", "FINANCIAL TABLE", "KEY STRENGTHS", 
-                      "GROWTH CATALYSTS", "INVESTMENT THESIS", "RISK ANALYSIS AND MITIGATION", "UPCOMING EVENTS", "PRICE CHART"]
-            bold_lines = ["Company Name:", "Industry:", "Sector:", "Business Description:", "Market Position:", 
-                         "Key Statistics:", "Financial Health:", "Analyst Insights:", "Market & Competition Risks:", 
-                         "1. Market Sensitivity Risk", "2. Industry Competition Risk", "Ex-Dividend Date:", 
-                         "Dividend Rate:", "Dividend Yield:"]
-            
-            for line in lines:
-                if line.strip():
-                    if any(header in line.strip() for header in headers):
-                        header_text = next(header for header in headers if header in line.strip())
-                        story.append(Paragraph(header_text, heading_style))
-                    elif any(bold_line in line.strip() for bold_line in bold_lines):
-                        if ':' in line:
-                            key, value = line.split(":", 1)
-                            if bullets:
-                                story.append(Paragraph(f'\u00A0\u00A0• <b>{key.strip()}</b>: {value.strip()}', normal_style))
-                            else:
-                                story.append(Paragraph(f'<b>{key.strip()}</b>: {value.strip()}', normal_style))
-                    else:
-                        story.append(Paragraph(line, normal_style))
-
-        # Process overview section with chart
-        overview_content_list = []
-        process_section(overview_content, overview_content_list)
+        doc = SimpleDocTemplate(filename, pagesize=letter, leftMargin=REPORT_MARGINS[0], rightMargin=REPORT_MARGINS[1], topMargin=REPORT_MARGINS[2], bottomMargin=REPORT_MARGINS[3])
+
+        stock_info = all_content['info']
+        overview = get_company_info(stock_info)
+        business = get_business_details(stock_info)
+        thesis = get_investment_thesis(stock_info, stock_de)
+        events = get_upcoming_events(stock_info)
+
+        financial_df = create_financial_table(all_content['income_stmt'], all_content['balance_sheet'])
 
         # Create stock price chart
-        plt.figure(figsize=(4, 3))
         history_data = all_content['history_data']
-        plt.plot(history_data.index, history_data['Close'], label='Close Price', color='blue')
-        history_data['MA50'] = history_data['Close'].rolling(window=50).mean()
-        history_data['MA200'] = history_data['Close'].rolling(window=200).mean()
-        plt.plot(history_data.index, history_data['MA50'], label='50-day MA', color='orange', linestyle='--')
-        plt.plot(history_data.index, history_data['MA200'], label='200-day MA', color='red', linestyle='--')
-        plt.title(f'{ticker} Stock Price - Last 12 Months', fontsize=8)
-        plt.xlabel('Date', fontsize=8)
-        plt.ylabel('Price (USD)', fontsize=8)
-        plt.tick_params(axis='both', labelsize=6)
-        plt.grid(True)
-        plt.legend(fontsize=6)
-        plt.tight_layout()
-
-        img_data = io.BytesIO()
-        plt.savefig(img_data, format='png', dpi=256, bbox_inches='tight')
-        img_data.seek(0)
-        plt.close()
-        
-        chart_img = Image(img_data)
-        chart_img.drawHeight = 2.3*inch
-        chart_img.drawWidth = 3.5*inch
-
-        # Create side-by-side layout for overview and chart
-        left_content = []
-        left_content.extend(overview_content_list)
-        left_wrapper = Table([[left_content]], colWidths=[doc.width/2.0 - 20])
-        left_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -15), 
-                                        ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        right_content = []
-        right_content.append(chart_img)
-        right_wrapper = Table([[right_content]], colWidths=[doc.width/2.0 - 20])
-        right_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0), 
-                                         ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                                         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                                         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')]))
-
-        overview_data = [[left_wrapper, right_wrapper]]
-        overview_table = Table(overview_data, colWidths=[doc.width/2.0 - 12, doc.width/2.0 - 12])
-        overview_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                          ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                          ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                                          ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        story.append(overview_table)
-        story.append(Spacer(1, 6))
-
-        # Process business section with financial table
-        left_content = []
-        left_content.append(Paragraph("BUSINESS AND MARKET POSITION", heading_style))
-
-        business_lines = business_content.split('\n')
-        for i, line in enumerate(business_lines):
-            if line.strip():
-                if not "BUSINESS AND MARKET POSITION" in line:
-                    if "Key Statistics:" in line:
-                        left_content.append(Paragraph(line, bold_style))
-                        for idx, metric in enumerate(final_metrics):
-                            stock_value = get_metric_value(ticker, metric)
-                            comp_value = comparable_metrics[idx]
-                            color_hex = get_metric_color(metric, stock_value, comp_value)
-                            metric_text = f"• {metric}: "
-                            stock_value_text = format_metric_value(metric, stock_value)
-                            comp_value_text = format_metric_value(metric, comp_value)
-                            paragraph = Paragraph(
-                                f"{metric_text}"f'<font color="{color_hex}">{stock_value_text}</font>'
-                                f" (Peer avg: {comp_value_text})", 
-                                normal_style
-                            )
-                            left_content.append(paragraph)
-                    elif any(bold_line in line.strip() for bold_line in ["Market Position:", "Business Performance:"]):
-                        left_content.append(Paragraph(line, bold_style))
-                    else:
-                        left_content.append(Paragraph(line, normal_style))
-
-        left_wrapper = Table([[left_content]], colWidths=[doc.width/2.0 - 20])
-        left_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -15),
-                                        ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        financial_table_content = []
-        financial_table_content.append(Paragraph("FINANCIAL TABLE (in millions USD)", heading_style))
-        financial_lines = [line.strip() for line in financial_content.split('\n') if line.strip()]
-        
-        table_data = []
-        headers = ['Year', 'Revenue', 'EBIT', 'Net Profit', 'EBITDA', 'ROI']
-        table_data.append(headers)
-        
-        for line in financial_lines:
-            parts = line.split()
-            if parts and len(parts) >= 6 and parts[0].startswith('202'):
-                table_data.append(parts)
-
-        financial_table = Table(table_data)
-        financial_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.maroon),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('BOX', (0, 0), (-1, -1), 1, colors.black),
-            ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('ROWPADDING', (0, 0), (-1, -1), 4)
-        ]))
-
-        right_content = []
-        right_content.extend(financial_table_content)
-        right_content.append(financial_table)
-        right_wrapper = Table([[right_content]], colWidths=[doc.width/2.0 - 20])
-        right_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0),
-                                         ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        side_by_side_data = [[left_wrapper, right_wrapper]]
-        side_by_side = Table(side_by_side_data, colWidths=[doc.width/2.0 - 12, doc.width/2.0 - 12])
-        side_by_side.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                                        ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        story.append(Spacer(1, 6))
-        story.append(side_by_side)
-        story.append(Spacer(1, 6))
-
-        # Process strengths and catalysts sections
-        strengths_content_list = []
-        process_section(strengths_content, strengths_content_list)
-        left_wrapper = Table([[strengths_content_list]], colWidths=[doc.width/2.0 - 20])
-        left_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -15),
-                                        ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        catalysts_content_list = []
-        process_section(catalysts_content, catalysts_content_list)
-        right_wrapper = Table([[catalysts_content_list]], colWidths=[doc.width/2.0 - 20])
-        right_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0),
-                                         ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        insights_data = [[left_wrapper, right_wrapper]]
-        insights_table = Table(insights_data, colWidths=[doc.width/2.0 - 12, doc.width/2.0 - 12])
-        insights_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                          ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                          ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                                          ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        story.append(insights_table)
-        story.append(Spacer(1, 6))
-
-        # Process investment thesis and risk analysis
-        risk_content_list = []
-        financial_insights = []
-        analyst_insights = []
-        
-        analysis_lines = analysis_content.split('\n')
-        current_section = None
-        
-        for line in analysis_lines:
-            if "INVESTMENT THESIS" in line:
-                current_section = "thesis"
-            elif "Financial Health:" in line:
-                current_section = "financial"
-                financial_insights.append(Paragraph(line, bold_style))
-            elif "Analyst Insights:" in line:
-                current_section = "analyst"
-                analyst_insights.append(Paragraph(line, bold_style))
-            elif "RISK ANALYSIS" in line:
-                current_section = "risk"
-            elif line.strip():
-                if current_section == "financial":
-                    if "Financial Health:" in line:
-                        continue
-                    elif "Debt to Equity:" in line:
-                        stock_de = float(line.split(": ")[1])
-                        color_hex = get_ratio_color("Debt to Equity", stock_de, comparable_debt_equity)
-                        financial_insights.append(Paragraph(
-                            f"• Debt to Equity: <font color='{color_hex}'>{stock_de:.1f}</font> (Peer avg: {comparable_debt_equity:.1f})", 
-                            normal_style
-                        ))
-                    elif "Current Ratio:" in line:
-                        stock_cr = float(line.split(": ")[1])
-                        color_hex = get_ratio_color("Current Ratio", stock_cr, comparable_current_ratio)
-                        financial_insights.append(Paragraph(
-                            f"• Current Ratio: <font color='{color_hex}'>{stock_cr:.1f}</font> (Peer avg: {comparable_current_ratio:.1f})", 
-                            normal_style
-                        ))
-                    else:
-                        financial_insights.append(Paragraph(line, normal_style))
-                elif current_section == "analyst":
-                    if "Analyst Insights:" in line:
-                        continue
-                    elif "Implied +/-:" in line:
-                        try:
-                            stock_upside = float(line.split(": ")[1].rstrip("%"))
-                            color_hex = get_ratio_color("Implied +/-", stock_upside, comparable_upside)
-                            analyst_insights.append(Paragraph(
-                                f"• Implied +/-: <font color='{color_hex}'>{stock_upside:.1f}%</font> (Peer avg: {comparable_upside:.1f}%)", 
-                                normal_style
-                            ))
-                        except ValueError:
-                            analyst_insights.append(Paragraph(line, normal_style))
-                    else:
-                        analyst_insights.append(Paragraph(line, normal_style))
-                elif current_section == "risk":
-                    if "RISK ANALYSIS" not in line:
-                        if any(bold_line in line.strip() for bold_line in ["Market & Competition Risks:", 
-                                                                         "1. Market Sensitivity Risk",
-                                                                         "2. Industry Competition Risk"]):
-                            risk_content_list.append(Paragraph(line, bold_style))
-                        else:
-                            risk_content_list.append(Paragraph(line, normal_style))
-
-        left_analysis = []
-        left_analysis.append(Paragraph("INVESTMENT THESIS", heading_style))
+        # Plain arrays shared by the averages and the plot, history_data itself is never modified
+        dates = history_data.index.to_numpy()
+        closes = history_data['Close'].to_numpy()
+        ma50, ma200 = moving_averages(closes, 50, 200)
+
+        with _chart_lock:
+            fig, ax = get_chart_figure()
+            ax.cla()
+            ax.plot(dates, closes, label='Close Price', color='blue')
+            ax.plot(dates, ma50, label='50-day MA', color='orange', linestyle='--')
+            ax.plot(dates, ma200, label='200-day MA', color='red', linestyle='--')
+            ax.set_title(f'{ticker} Stock Price - Last 12 Months', fontsize=8)
+            ax.set_xlabel('Date', fontsize=8)
+            ax.set_ylabel('Price (USD)', fontsize=8)
+            ax.tick_params(axis='both', labelsize=6)
+            ax.grid(True)
+            ax.legend(fontsize=6)
+            fig.tight_layout()
+
+            # The image is drawn at 3.5 x 2.3 inches, so 150 dpi is already more than the page needs
+            img_data = io.BytesIO()
+            fig.savefig(img_data, format='png', dpi=150)
+            chart_png = img_data.getvalue()
+
+        # build_story() runs once per document, so anything it displays is worked out here just once
+        metric_colors = get_metric_colors(final_metrics, stock_metric_values, comparable_metrics)
+        metric_lines = []
+        for idx, metric in enumerate(final_metrics):
+            stock_value_text = format_metric_value(metric, stock_metric_values[idx])
+            comp_value_text = format_metric_value(metric, comparable_metrics[idx])
+            metric_lines.append(f'• {metric}: <font color="{metric_colors[idx]}">{stock_value_text}</font>'
+                                f" (Peer avg: {comp_value_text})")
+        table_data = financial_table_rows(financial_df)
+
+        def key_value(key, value, bullet=False):
+            prefix = '\u00A0\u00A0• ' if bullet else ''
+            return Paragraph(f'{prefix}<b>{key}</b>: {value}', NORMAL_STYLE)
+
+        def bullet_list(lines):
+            return [Paragraph(line, NORMAL_STYLE) for line in lines]
+
+        def build_story():
+            story = []
+
+            overview_content_list = [
+                Paragraph("COMPANY OVERVIEW", HEADING_STYLE),
+                key_value("Company Name", overview.name),
+                key_value("Industry", overview.industry),
+                key_value("Sector", overview.sector)
+            ]
+            if overview.description:
+                overview_content_list.append(key_value("Business Description", ""))
+                overview_content_list.append(Paragraph(overview.description, NORMAL_STYLE))
+
+
+            chart_img = Image(io.BytesIO(chart_png))
+            chart_img.drawHeight = 2.3*inch
+            chart_img.drawWidth = 3.5*inch
+
+            # Create side-by-side layout for overview and chart
+            left_content = []
+            left_content.extend(overview_content_list)
+            left_wrapper = Table([[left_content]], colWidths=[doc.width/2.0 - 20], style=LEFT_COLUMN_STYLE)
+
+            right_content = []
+            right_content.append(chart_img)
+            right_wrapper = Table([[right_content]], colWidths=[doc.width/2.0 - 20], style=CHART_COLUMN_STYLE)
+
+            overview_data = [[left_wrapper, right_wrapper]]
+            overview_table = Table(overview_data, colWidths=[doc.width/2.0 - 12, doc.width/2.0 - 12], style=SIDE_BY_SIDE_STYLE)
+
+            story.append(overview_table)
+            story.append(Spacer(1, 6))
+
+            # Process business section with financial table
+            left_content = []
+            left_content.append(Paragraph("BUSINESS AND MARKET POSITION", HEADING_STYLE))
+
+            if business.market_cap:
+                left_content.append(Paragraph("Market Position:", BOLD_STYLE))
+                left_content.append(Paragraph(f"• Market Cap: ${business.market_cap/1e9:.1f}B", NORMAL_STYLE))
+            if business.shares_outstanding:
+                left_content.append(Paragraph(f"• Shares Outstanding: {business.shares_outstanding/1e6:.1f}M", NORMAL_STYLE))
+            if business.float_shares:
+                left_content.append(Paragraph(f"• Float: {business.float_shares/1e6:.1f}M", NORMAL_STYLE))
+
+            left_content.append(Paragraph("Key Statistics:", BOLD_STYLE))
+            left_content.extend(Paragraph(line, NORMAL_STYLE) for line in metric_lines)
+
+            left_wrapper = Table([[left_content]], colWidths=[doc.width/2.0 - 20], style=LEFT_COLUMN_STYLE)
+
+            financial_table_content = []
+            financial_table_content.append(Paragraph("FINANCIAL TABLE (in millions USD)", HEADING_STYLE))
+            financial_table = Table(table_data, style=FINANCIAL_TABLE_STYLE)
+
+            right_content = []
+            right_content.extend(financial_table_content)
+            right_content.append(financial_table)
+            right_wrapper = Table([[right_content]], colWidths=[doc.width/2.0 - 20], style=RIGHT_COLUMN_STYLE)
+
+            side_by_side_data = [[left_wrapper, right_wrapper]]
+            side_by_side = Table(side_by_side_data, colWidths=[doc.width/2.0 - 12, doc.width/2.0 - 12], style=SIDE_BY_SIDE_STYLE)
+
+            story.append(Spacer(1, 6))
+            story.append(side_by_side)
+            story.append(Spacer(1, 6))
+
+            # Process strengths and catalysts sections
+            strengths_content_list = [Paragraph("KEY STRENGTHS", HEADING_STYLE)] + bullet_list(narrative['strengths'])
+            left_wrapper = Table([[strengths_content_list]], colWidths=[doc.width/2.0 - 20], style=LEFT_COLUMN_STYLE)
+
+            catalysts_content_list = [Paragraph("GROWTH CATALYSTS", HEADING_STYLE)] + bullet_list(narrative['catalysts'])
+            right_wrapper = Table([[catalysts_content_list]], colWidths=[doc.width/2.0 - 20], style=RIGHT_COLUMN_STYLE)
+
+            insights_data = [[left_wrapper, right_wrapper]]
+            insights_table = Table(insights_data, colWidths=[doc.width/2.0 - 12, doc.width/2.0 - 12], style=SIDE_BY_SIDE_STYLE)
+
+            story.append(insights_table)
+            story.append(Spacer(1, 6))
+
+            # Process investment thesis and risk analysis
+            financial_insights = [Paragraph("Financial Health:", BOLD_STYLE)]
+            if thesis.total_cash:
+                financial_insights.append(Paragraph(f"• Cash Position: ${thesis.total_cash/1e9:.1f}B", NORMAL_STYLE))
+            if thesis.total_debt:
+                financial_insights.append(Paragraph(f"• Total Debt: ${thesis.total_debt/1e9:.1f}B", NORMAL_STYLE))
+            color_hex = get_ratio_color("Debt to Equity", thesis.debt_to_equity, comparable_debt_equity)
+            financial_insights.append(Paragraph(
+                f"• Debt to Equity: <font color='{color_hex}'>{thesis.debt_to_equity:.1f}</font> (Peer avg: {comparable_debt_equity:.1f})", 
+                NORMAL_STYLE
+            ))
+            if thesis.current_ratio:
+                color_hex = get_ratio_color("Current Ratio", thesis.current_ratio, comparable_current_ratio)
+                financial_insights.append(Paragraph(
+                    f"• Current Ratio: <font color='{color_hex}'>{thesis.current_ratio:.1f}</font> (Peer avg: {comparable_current_ratio:.1f})", 
+                    NORMAL_STYLE
+                ))
+
+            analyst_insights = [Paragraph("Analyst Insights:", BOLD_STYLE)]
+            if thesis.analyst_rating:
+                analyst_insights.append(Paragraph(f"• Analyst Rating (1-5): {thesis.analyst_rating:.1f}", NORMAL_STYLE))
+            if thesis.recommendation:
+                analyst_insights.append(Paragraph(f"• Recommendation: {thesis.recommendation.upper()}", NORMAL_STYLE))
+            if thesis.analyst_count:
+                analyst_insights.append(Paragraph(f"• Number of Analysts: {thesis.analyst_count}", NORMAL_STYLE))
+            if thesis.target_price:
+                analyst_insights.append(Paragraph(f"• Mean Target Price: ${thesis.target_price:.1f}", NORMAL_STYLE))
+            if thesis.upside is not None:
+                color_hex = get_ratio_color("Implied +/-", thesis.upside, comparable_upside)
+                analyst_insights.append(Paragraph(
+                    f"• Implied +/-: <font color='{color_hex}'>{thesis.upside:.1f}%</font> (Peer avg: {comparable_upside:.1f}%)", 
+                    NORMAL_STYLE
+                ))
+
+            risk_content_list = bullet_list(narrative['risks'])
+
+            left_analysis = []
+            left_analysis.append(Paragraph("INVESTMENT THESIS", HEADING_STYLE))
         
-        financial_wrapper = Table([[financial_insights]], colWidths=[doc.width/4.0 - 20])
-        financial_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -5),
-                                             ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
+            financial_wrapper = Table([[financial_insights]], colWidths=[doc.width/4.0 - 20], style=INSET_COLUMN_STYLE)
         
-        analyst_wrapper = Table([[analyst_insights]], colWidths=[doc.width/4.0 - 20])
-        analyst_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0),
-                                           ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
+            analyst_wrapper = Table([[analyst_insights]], colWidths=[doc.width/4.0 - 20], style=RIGHT_COLUMN_STYLE)
         
-        insights_data = [[financial_wrapper, analyst_wrapper]]
-        insights_table = Table(insights_data, colWidths=[doc.width/4.0, doc.width/4.0])
-        insights_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                          ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                          ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                                          ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
+            insights_data = [[financial_wrapper, analyst_wrapper]]
+            insights_table = Table(insights_data, colWidths=[doc.width/4.0, doc.width/4.0], style=SIDE_BY_SIDE_STYLE)
         
-        left_analysis.append(insights_table)
-
-        events_content_list = []
-        process_section(events_content, events_content_list, True)
-        left_wrapper = Table([[left_analysis], [events_content_list]], colWidths=[doc.width/2.0 - 20])
-        left_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), -5),
-                                        ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        right_analysis = []
-        right_analysis.append(Paragraph("RISK ANALYSIS AND MITIGATION", heading_style))
-        right_analysis.extend(risk_content_list)
+            left_analysis.append(insights_table)
+
+            events_content_list = []
+            if events.earnings_date:
+                events_content_list.append(Paragraph("UPCOMING EVENTS", HEADING_STYLE))
+                events_content_list.append(Paragraph(f"Next Earnings Date: {events.earnings_date}", NORMAL_STYLE))
+            if events.ex_dividend_date:
+                events_content_list.append(key_value("Ex-Dividend Date", events.ex_dividend_date, bullet=True))
+                if events.dividend_rate:
+                    events_content_list.append(key_value("Dividend Rate", f"${events.dividend_rate:.2f}", bullet=True))
+                if events.dividend_yield:
+                    events_content_list.append(key_value("Dividend Yield", f"{events.dividend_yield*100:.2f}%", bullet=True))
+            left_wrapper = Table([[left_analysis], [events_content_list]], colWidths=[doc.width/2.0 - 20], style=INSET_COLUMN_STYLE)
+
+            right_analysis = []
+            right_analysis.append(Paragraph("RISK ANALYSIS AND MITIGATION", HEADING_STYLE))
+            right_analysis.extend(risk_content_list)
         
-        right_wrapper = Table([[right_analysis]], colWidths=[doc.width/2.0 - 20])
-        right_wrapper.setStyle(TableStyle([('LEFTPADDING', (0, 0), (-1, -1), 0),
-                                         ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
+            right_wrapper = Table([[right_analysis]], colWidths=[doc.width/2.0 - 20], style=RIGHT_COLUMN_STYLE)
         
-        analysis_data = [[left_wrapper, right_wrapper]]
-        analysis_table = Table(analysis_data, colWidths=[doc.width/2.0, doc.width/2.0])
-        analysis_table.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                          ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                          ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                                          ('RIGHTPADDING', (0, 0), (-1, -1), 10)]))
-
-        story.append(Spacer(1, 2))
-        story.append(analysis_table)
+            analysis_data = [[left_wrapper, right_wrapper]]
+            analysis_table = Table(analysis_data, colWidths=[doc.width/2.0, doc.width/2.0], style=SIDE_BY_SIDE_STYLE)
 
-        doc.build(story)
-        print(f"\nPDF report saved as: {filename}")
+            story.append(Spacer(1, 2))
+            story.append(analysis_table)
+            return story
 
+        # The Word version is written while the PDF is built. Each gets its own story, since
+        # the PDF build lays out, splits and loads the flowables it is given
         docx_name = f"{ticker}_Analysis_{datetime.now().strftime('%Y%m%d')}.docx"
-        convert_pdf2docx(filename, docx_name)
+        docx_future = _FETCH_POOL.submit(story_to_docx, build_story(), docx_name)
+        doc.build(build_story())
+        print(f"\nPDF report saved as: {filename}")
+        docx_future.result()
 
     except Exception as e:
         print(f"Error creating PDF report: {e}")
         print(f"Error details: {str(e)}")
 
-def extract_ticker(s):
-    try:
-        s = s.strip('"')
-        parts = s.split("': '")
-        if len(parts) == 2:
-            # Return just the ticker part, removing the trailing quote
-            return parts[1].rstrip("'")
-        else:
-            print(f"Warning: Unexpected format in string: {s}")
-            return s
-    except Exception as e:
-        print(f"Error processing string: {s}")
-        print(f"Error details: {e}")
-        return s
-
 def get_dividend_history(ticker):
     url = f"https://api.nasdaq.com/api/quote/{ticker}/dividends?assetclass=stocks"
     headers = {
@@ -962,7 +987,7 @@ def get_dividend_history(ticker):
         'Referer': 'https://www.nasdaq.com/'
     }
     
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
     data = response.json()
     filename=""
     if data['data']:
@@ -979,10 +1004,10 @@ def get_fed_rate():
         'Accept': 'text/html'
     }
     
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, 'html.parser')
-    rate = soup.find('span', {'class': 'series-meta-observation-value'}).text
-    return float(rate)
+    response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    tree = html.fromstring(response.content)
+    rate = tree.xpath("//span[contains(concat(' ', normalize-space(@class), ' '), ' series-meta-observation-value ')]")[0]
+    return float(rate.text_content())
 
 def calculate_dividend_growth(filename):
    df = pd.read_csv(filename, sep='|')
@@ -999,189 +1024,291 @@ def get_GGM(forward_dividend,fed_rate,beta,spy_total_return, dividend_growth) :
     expected_price = forward_dividend/(fed_rate + (beta*(spy_total_return - fed_rate))-dividend_growth)
     return expected_price
 
-def main():
-        # try:
-            ticker = input("\nEnter Stock Ticker (or 'quit' to exit): ").upper()
-            print("\nFetching data...")
-
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365)
-
-            stock = yf.Ticker(ticker)
-            all_content = {
-                'financials':stock.financials,
-                'info': stock.info,
-                'income_stmt': stock.income_stmt,
-                'balance_sheet': stock.balance_sheet,
-                'news': stock.news,
-                'history_data':stock.history(start=start_date, end=end_date)
-            }
-            comparable_yf_fetched_information[ticker] = all_content
-            
-            file_path = '35stocks.xlsx'
-            df = pd.read_excel(file_path, sheet_name='Sheet1')
-            df_transposed = df.T
-            df_transposed.columns = ["Stock", "Metric_1", "Metric_2"]
-            df_transposed.dropna(how="all", inplace=True)
-            df_transposed.reset_index(drop=True, inplace=True)
-            metrics=[]
-            final_metrics= []
-            for index, row in df_transposed.iterrows():
-                stock_name = row['Stock']
-                metrics = [row['Metric_1'], row['Metric_2']]
-                if stock_name == ticker:
-                    final_metrics = metrics
-                    break
-
-            print(final_metrics)
-
-            file_path = '35stockscomparable.xlsx'
-            df = pd.read_excel(file_path, sheet_name='Sheet1')
-            original_columns = df.columns.tolist()
-            comparable_companies = []
-            if ticker in original_columns:
-                column_data = df[ticker].iloc[0:].dropna().tolist()  # Changed from iloc[1:] to iloc[0:]
-                comparable_companies = []
-                for company in column_data:
-                    try:
-                        ticker_symbol = extract_ticker(company)
-                        if ticker_symbol and ticker_symbol.lower() != "private":
-                            comparable_companies.append(ticker_symbol)
-                    except Exception as e:
-                        print(f"Error processing company: {company}")
-                        print(f"Error details: {e}")
-                        continue
-            else:
-                print(f"\n{ticker} not found in columns!")
-
-            comparable_debt_equity = []
-            comparable_current_ratio = []
-            comparable_upside = []
-            comparable_companies_selected = []
-
-            for tick in comparable_companies:
-                try:
-                    if tick.lower() == "private":
-                        continue
-                        # comparable_debt_equity.append(0)
-                        # comparable_current_ratio.append(0)
-                        # comparable_upside.append(0)
-                    else:
-                        print(f"Fetching data for {tick}...")  # Debug print
-                        comparable_info = yf.Ticker(tick)
-                        comparable_stock_info = comparable_info.info
-                        
-                        # Store all content first
-                        comparable_all_content = {
-                            'financials': comparable_info.financials,
-                            'info': comparable_info.info,
-                            'income_stmt': comparable_info.income_stmt,
-                            'balance_sheet': comparable_info.balance_sheet,
-                            'news': comparable_info.news,
-                            'history_data': comparable_info.history(start=start_date, end=end_date)
-                        }
-                        comparable_yf_fetched_information[tick] = comparable_all_content
-                        
-                        # Safe get for debt to equity
-                        # de_ratio = comparable_stock_info.get('debtToEquity', 0)
-                        de_ratio = get_debt_to_equity(tick)
-                        if de_ratio > 0 :
-                            comparable_debt_equity.append(de_ratio)
-                        
-                        # Safe get for current ratio
-                        curr_ratio = comparable_stock_info.get('currentRatio', 0)
-                        if curr_ratio > 0:
-                            comparable_current_ratio.append(curr_ratio)
-                        
-                        # Safe get for prices and upside calculation
-                        current_price = comparable_stock_info.get('currentPrice', comparable_stock_info.get('regularMarketPrice', 0))
-                        target_price = comparable_stock_info.get('targetMeanPrice', current_price)
-                        
-                        if current_price and target_price:  # Only calculate if both values exist
-                            upside = ((target_price / current_price) - 1) * 100
-                        else:
-                            upside = 0
-                            
-                        if upside > 0 :
-                            comparable_upside.append(upside)
-                        comparable_companies_selected.append(tick)
-                        
-                        print(f"Successfully processed {tick}")  # Debug print
-                        
-                except Exception as e:
-                    print(f"Error processing {tick}: {str(e)}")  # Debug print
-                    # comparable_debt_equity.append(0)
-                    # comparable_current_ratio.append(0)
-                    # comparable_upside.append(0)
-
-            # Calculate means with safety checks
-            if len(comparable_debt_equity) > 0:
-                comparable_de_mean = sum(comparable_debt_equity) / len(comparable_debt_equity)
-            else:
-                comparable_de_mean = 0
+METRICS_FILE = '35stocks.xlsx'
+COMPARABLES_FILE = '35stockscomparable.xlsx'
+# "'Company Name': 'TICKER'" cells: exactly one "': '" separator, trailing quotes dropped from the ticker
+_TICKER_RE = re.compile(r"^(?:(?!': ').)*': '((?:(?!': ').)*?)'*\Z", re.S)
+# Peer averages are built from the key statistics, so they are kept no longer than those
+PEER_AVERAGES_TTL = KEY_STATS_TTL
 
-            if len(comparable_current_ratio) > 0:
-                comparable_cr_mean = sum(comparable_current_ratio) / len(comparable_current_ratio)
-            else:
-                comparable_cr_mean = 0
+def read_workbook(path):
+    """
+    Sheet1 of an Excel workbook, served from a pickled copy under .cache/ until the workbook changes
+    Unpickling a DataFrame is a small fraction of the time openpyxl needs to parse the xlsx
+    """
+    cached_path = os.path.join(file_cache.directory, f"{os.path.basename(path)}.pkl")
+    try:
+        if os.path.getmtime(cached_path) >= os.path.getmtime(path):
+            return pd.read_pickle(cached_path)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
 
-            if len(comparable_upside) > 0:
-                comparable_up_mean = sum(comparable_upside) / len(comparable_upside)
+    df = pd.read_excel(path, sheet_name='Sheet1')
+    try:
+        os.makedirs(file_cache.directory, exist_ok=True)
+        df.to_pickle(cached_path)
+    except OSError as e:
+        print(f"Warning: Could not cache {path}: {e}")
+    return df
+
+@lru_cache(maxsize=None)
+def load_metrics_map():
+    """Ticker -> [Metric_1, Metric_2] from the metrics workbook, parsed once per process"""
+    df = read_workbook(METRICS_FILE)
+    df_transposed = df.T
+    df_transposed.columns = ["Stock", "Metric_1", "Metric_2"]
+    # Keep the first row for a ticker, as the old row-by-row search did
+    df_transposed = df_transposed.dropna(how="all").drop_duplicates(subset="Stock")
+
+    return dict(zip(df_transposed["Stock"],
+                    map(list, zip(df_transposed["Metric_1"], df_transposed["Metric_2"]))))
+
+@lru_cache(maxsize=None)
+def load_comparables_map():
+    """Ticker -> comparable company tickers from the comparables workbook, parsed once per process"""
+    df = read_workbook(COMPARABLES_FILE)
+
+    comparables_map = {}
+    for column in df.columns:
+        if pd.api.types.is_numeric_dtype(df[column]):
+            comparables_map[column] = []
+            continue
+        # Parsed a whole column at a time; non-text cells become NaN and drop out, unmatched cells are kept as they are
+        companies = df[column].dropna().str.strip('"').dropna()
+        tickers = companies.str.extract(_TICKER_RE, expand=False)
+        matched = tickers.notna()
+        for company in companies[~matched]:
+            print(f"Warning: Unexpected format in string: {company}")
+        tickers = tickers.where(matched, companies)
+        comparables_map[column] = tickers[(tickers != '') & (tickers.str.lower() != 'private')].tolist()
+    return comparables_map
+
+def load_all_market_data(tickers, period='1y'):
+    """
+    Daily closing prices for every ticker, with everything not in .cache/ fetched by a single batched yf.download call
+    Tickers missing from the batch fall back to an individual Ticker.history request
+    """
+    histories = {}
+    for ticker in tickers:
+        cached_history = file_cache.get(f"{ticker}_history", YF_CACHE_TTL['history'])
+        if cached_history is not None:
+            histories[ticker] = cached_history
+    missing = [ticker for ticker in tickers if ticker not in histories]
+    if not missing:
+        return histories
+
+    # The chart only draws Close, so dividends/splits aren't requested and the other price columns aren't kept
+    data = yf.download(missing, period=period, interval='1d', actions=False, threads=True, progress=False,
+                       group_by='ticker', auto_adjust=True)
+    for ticker in missing:
+        if isinstance(data.columns, pd.MultiIndex):
+            history = data[ticker][['Close']].dropna(how='all') if ticker in data.columns.get_level_values(0) else None
+        else:
+            # Older yfinance versions return flat columns when only one ticker is requested
+            history = data[['Close']] if len(missing) == 1 else None
+        if history is None or history.empty:
+            try:
+                history = yf.Ticker(ticker).history(period=period, interval='1d', actions=False)[['Close']]
+            except Exception as e:
+                # A delisted or malformed peer shouldn't stop the rest of the report
+                print(f"Could not fetch price history for {ticker}: {e}")
+                history = pd.DataFrame(columns=['Close'])
+        if not history.empty:
+            file_cache.set(f"{ticker}_history", history)
+        histories[ticker] = history
+    return histories
+
+def positive_mean(values):
+    """Mean of the positive values, ignoring zeros and missing data; 0 when there are none"""
+    values = np.asarray(values, dtype=np.float64)
+    positive = values[values > 0]
+    return float(positive.mean()) if positive.size else 0
+
+def compute_peer_averages(final_metrics, comparable_companies, history_data):
+    """
+    Peer averages for the report: (metric means, debt to equity, current ratio, upside)
+    Fills comparable_yf_fetched_information for every peer on the way, the metric getters read from it
+    """
+    comparable_debt_equity = []
+    comparable_current_ratio = []
+    comparable_upside = []
+    comparable_companies_selected = []
+
+    # Every request for every peer is independent, so all of them are in flight before the loop below waits on any
+    peers = yf.Tickers(list(comparable_companies))
+    info_futures = {tick: _FETCH_POOL.submit(_get_ticker_info, tick) for tick in comparable_companies}
+    statement_futures = {}
+    de_futures = {}
+    for tick in comparable_companies:
+        peer = peers.tickers[tick.upper()]
+        statement_futures[tick] = {
+            'financials': _FETCH_POOL.submit(fetch_yf, tick, 'financials', lambda peer=peer: peer.financials),
+            'income_stmt': _FETCH_POOL.submit(fetch_yf, tick, 'income_stmt', lambda peer=peer: peer.income_stmt),
+            'balance_sheet': _FETCH_POOL.submit(fetch_yf, tick, 'balance_sheet', lambda peer=peer: peer.balance_sheet),
+            'news': _FETCH_POOL.submit(fetch_yf, tick, 'news', lambda peer=peer: peer.news)
+        }
+        de_futures[tick] = _FETCH_POOL.submit(get_debt_to_equity, tick)
+
+    for tick in comparable_companies:
+        try:
+            if tick.lower() == "private":
+                continue
+                # comparable_debt_equity.append(0)
+                # comparable_current_ratio.append(0)
+                # comparable_upside.append(0)
             else:
-                comparable_up_mean = 0
-
-            # Debug print final results
-            print(f"\nFinal Results:")
-            print(f"Number of companies processed : {len(comparable_companies_selected)}")
-            print(f"Debt to Equity values         : {comparable_debt_equity}")
-            print(f"Current Ratio values          : {comparable_current_ratio}")
-            print(f"Upside values                 : {comparable_upside}\n")
-
-            comparable_metrics = []
-            for metric in final_metrics:
-                print("METRIC : ",metric)
-                considered_companies = 0
-                metric_sum = 0
-                for tick in comparable_companies:
-                    if tick == 'PRIVATE' or tick=='Private' or tick.lower() == 'private':
-                        metric_value = 0
-                    else:
-                        if metric == "EV/EBITDA":
-                            metric_value = get_ev_ebitda(tick) 
-                        elif metric == "P/E TTM":
-                            metric_value = get_trailing_pe(tick)
-                        elif metric == "P/NAV":
-                            metric_value = get_price_book(tick)
-                        elif metric == "Dividend Yield":
-                            metric_value = get_divident_yield(tick)
-                        elif metric == "P/S TTM":
-                            metric_value = get_price_sales(tick)
-                        elif metric == "P/AUM":
-                            metric_value = get_assets_under_management_ratio(tick)
-                        elif metric == "Price-to-FFO":
-                            metric_value = get_pffo(tick)
-                        else:
-                            metric_value = 0
-
-                    # Move this outside the else block
-                    if metric_value > 0:
-                        considered_companies += 1
-                        metric_sum += metric_value
-
-                # Add safety check before division
-                if considered_companies > 0:
-                    comparable_metrics.append(metric_sum/considered_companies)
+                print(f"Fetching data for {tick}...")  # Debug print
+                comparable_stock_info = info_futures[tick].result(timeout=FETCH_TIMEOUT)
+                statements = statement_futures[tick]
+                
+                # Store all content first
+                comparable_all_content = {
+                    'financials': _collect(statements['financials'], pd.DataFrame(), f"fetching financials for {tick}"),
+                    'info': comparable_stock_info,
+                    'income_stmt': _collect(statements['income_stmt'], pd.DataFrame(), f"fetching income statement for {tick}"),
+                    'balance_sheet': _collect(statements['balance_sheet'], pd.DataFrame(), f"fetching balance sheet for {tick}"),
+                    'news': _collect(statements['news'], [], f"fetching news for {tick}"),
+                    'history_data': history_data[tick]
+                }
+                comparable_yf_fetched_information[tick] = comparable_all_content
+                
+                # Safe get for debt to equity
+                # de_ratio = comparable_stock_info.get('debtToEquity', 0)
+                de_ratio = _collect(de_futures[tick], 0, f"fetching debt to equity for {tick}")
+                if de_ratio > 0 :
+                    comparable_debt_equity.append(de_ratio)
+                
+                # Safe get for current ratio
+                curr_ratio = comparable_stock_info.get('currentRatio', 0)
+                if curr_ratio > 0:
+                    comparable_current_ratio.append(curr_ratio)
+                
+                # Safe get for prices and upside calculation
+                current_price = comparable_stock_info.get('currentPrice', comparable_stock_info.get('regularMarketPrice', 0))
+                target_price = comparable_stock_info.get('targetMeanPrice', current_price)
+                
+                if current_price and target_price:  # Only calculate if both values exist
+                    upside = ((target_price / current_price) - 1) * 100
                 else:
-                    comparable_metrics.append(0)  # or whatever default value you want to use\
+                    upside = 0
+                    
+                if upside > 0 :
+                    comparable_upside.append(upside)
+                comparable_companies_selected.append(tick)
+                
+                print(f"Successfully processed {tick}")  # Debug print
+                
+        except Exception as e:
+            print(f"Error processing {tick}: {str(e)}")  # Debug print
+            # comparable_debt_equity.append(0)
+            # comparable_current_ratio.append(0)
+            # comparable_upside.append(0)
+
+    comparable_de_mean = positive_mean(comparable_debt_equity)
+    comparable_cr_mean = positive_mean(comparable_current_ratio)
+    comparable_up_mean = positive_mean(comparable_upside)
+
+    # Debug print final results
+    print(f"\nFinal Results:")
+    print(f"Number of companies processed : {len(comparable_companies_selected)}")
+    print(f"Debt to Equity values         : {comparable_debt_equity}")
+    print(f"Current Ratio values          : {comparable_current_ratio}")
+    print(f"Upside values                 : {comparable_upside}\n")
+
+    # Every metric lookup for every peer is an independent request, so start them all at once
+    peer_metric_futures = {}
+    for metric in final_metrics:
+        fetch = METRIC_GETTERS.get(metric, _no_metric)
+        peer_metric_futures[metric] = [_FETCH_POOL.submit(fetch, tick) for tick in comparable_companies]
+
+    comparable_metrics = []
+    for metric in final_metrics:
+        print("METRIC : ",metric)
+        values = [_collect(future, 0, f"fetching {metric} for {tick}")
+                  for tick, future in zip(comparable_companies, peer_metric_futures[metric])]
+        comparable_metrics.append(positive_mean(values))
+
+    return comparable_metrics, comparable_de_mean, comparable_cr_mean, comparable_up_mean
+
+def workbooks_version():
+    """Changes whenever either workbook is saved, for keys of anything derived from them"""
+    return f"{os.path.getmtime(METRICS_FILE)}_{os.path.getmtime(COMPARABLES_FILE)}"
+
+@dataclass
+class ReportState:
+    """Workbook lookups shared by every ticker processed in one session"""
+    metrics_map: dict
+    comparables_map: dict
+
+def _bootstrap():
+    """Parse both workbooks once, before the first ticker is entered"""
+    return ReportState(load_metrics_map(), load_comparables_map())
+
+def process_ticker(ticker, state):
+    """Fetch everything the report needs for one ticker and write it"""
+    print("\nFetching data...")
+    comparable_yf_fetched_information.clear()
+
+    stock = yf.Ticker(ticker)
+    # The ticker's Yahoo payloads are independent, so they download together while the price history loads
+    content_futures = {
+        'financials': _FETCH_POOL.submit(fetch_yf, ticker, 'financials', lambda: stock.financials),
+        'info': _FETCH_POOL.submit(_get_ticker_info, ticker),
+        'income_stmt': _FETCH_POOL.submit(fetch_yf, ticker, 'income_stmt', lambda: stock.income_stmt),
+        'balance_sheet': _FETCH_POOL.submit(fetch_yf, ticker, 'balance_sheet', lambda: stock.balance_sheet),
+        'news': _FETCH_POOL.submit(fetch_yf, ticker, 'news', lambda: stock.news)
+    }
 
-            # # Create PDF report
-            print("\nGenerating PDF report...")
-            create_pdf_report(ticker, all_content, final_metrics, comparable_metrics, comparable_de_mean, comparable_cr_mean, comparable_up_mean)
-         
+    final_metrics = list(state.metrics_map.get(ticker, []))
+    print(final_metrics)
+
+    comparable_companies = list(state.comparables_map.get(ticker, []))
+    if ticker not in state.comparables_map:
+        print(f"\n{ticker} not found in columns!")
+
+    # Price history for the ticker and all its peers in one batched download
+    history_data = load_all_market_data([ticker, *comparable_companies])
+    # The report can't be built without info and financials; the rest just show up empty if they fail
+    all_content = {
+        'financials': content_futures['financials'].result(timeout=FETCH_TIMEOUT),
+        'info': content_futures['info'].result(timeout=FETCH_TIMEOUT),
+        'income_stmt': _collect(content_futures['income_stmt'], pd.DataFrame(), "fetching income statement"),
+        'balance_sheet': _collect(content_futures['balance_sheet'], pd.DataFrame(), "fetching balance sheet"),
+        'news': _collect(content_futures['news'], [], "fetching news")
+    }
+    all_content['history_data'] = history_data[ticker]
+    comparable_yf_fetched_information[ticker] = all_content
+
+    # The averages depend only on the workbooks and cached Yahoo data, so retyping a ticker reuses them
+    averages_key = f"{ticker}_peer_averages_{workbooks_version()}"
+    peer_averages = file_cache.get(averages_key, PEER_AVERAGES_TTL)
+    if peer_averages is None:
+        peer_averages = compute_peer_averages(final_metrics, comparable_companies, history_data)
+        # All zeros usually means Yahoo was throttling, so don't keep it
+        if any(peer_averages[0]) or any(peer_averages[1:]):
+            file_cache.set(averages_key, peer_averages)
+    comparable_metrics, comparable_de_mean, comparable_cr_mean, comparable_up_mean = peer_averages
+
+    print("\nGenerating PDF report...")
+    create_pdf_report(ticker, all_content, final_metrics, comparable_metrics, comparable_de_mean, comparable_cr_mean, comparable_up_mean)
 
-        # except Exception as e:
-        #     print(f"Error processing request: {e}")
-        #     print("Please try again with a valid ticker symbol.")
+def main():
+    state = _bootstrap()
+    while True:
+        try:
+            ticker = input("\nEnter Stock Ticker (or 'quit' to exit): ").strip().upper()
+        except EOFError:
+            break
+        if ticker == 'QUIT':
+            break
+        if not ticker:
+            continue
+
+        try:
+            process_ticker(ticker, state)
+        except Exception as e:
+            print(f"Error processing request: {e}")
+            print("Please try again with a valid ticker symbol.")
 
 if __name__ == "__main__":
     print("Stock Financial Analysis Tool")
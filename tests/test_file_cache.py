@@ -0,0 +1,108 @@
+import os
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from datetime import timedelta
+from io import StringIO
+
+from file_cache import FileCache, cached
+
+
+class FileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = FileCache(os.path.join(self.tmp.name, 'cache'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def age(self, key, seconds):
+        path = self.cache._path(key)
+        then = time.time() - seconds
+        os.utime(path, (then, then))
+
+    def test_round_trip(self):
+        self.cache.set('AAPL_info', {'currentPrice': 1.5})
+        self.assertEqual(self.cache.get('AAPL_info', timedelta(hours=1)), {'currentPrice': 1.5})
+
+    def test_missing_key(self):
+        self.assertIsNone(self.cache.get('nothing', timedelta(hours=1)))
+
+    def test_expired_entry(self):
+        self.cache.set('AAPL_info', {'currentPrice': 1.5})
+        self.age('AAPL_info', 2 * 3600)
+        self.assertIsNone(self.cache.get('AAPL_info', timedelta(hours=1)))
+        self.assertIsNotNone(self.cache.get('AAPL_info', timedelta(hours=3)))
+
+    def test_corrupt_entry(self):
+        self.cache.set('AAPL_info', 1)
+        with open(self.cache._path('AAPL_info'), 'wb') as f:
+            f.write(b'not a pickle')
+        self.assertIsNone(self.cache.get('AAPL_info', timedelta(hours=1)))
+
+    def test_keys_are_made_file_safe(self):
+        self.cache.set('BRK/B info', 1)
+        self.assertEqual(os.listdir(self.cache.directory), ['BRK_B_info.pkl'])
+        self.assertEqual(self.cache.get('BRK/B info', timedelta(hours=1)), 1)
+
+    def test_overwrite_leaves_no_temporary_files(self):
+        self.cache.set('key', 1)
+        self.cache.set('key', 2)
+        self.assertEqual(os.listdir(self.cache.directory), ['key.pkl'])
+        self.assertEqual(self.cache.get('key', timedelta(hours=1)), 2)
+
+    def test_unwritable_directory_warns(self):
+        blocker = os.path.join(self.tmp.name, 'blocker')
+        open(blocker, 'w').close()
+        cache = FileCache(blocker)
+        output = StringIO()
+        with redirect_stdout(output):
+            cache.set('key', 1)
+        self.assertIn('Could not write cache entry key', output.getvalue())
+
+
+class CachedTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = FileCache(self.tmp.name)
+        self.calls = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_result_is_reused(self):
+        @cached(self.cache, timedelta(hours=1))
+        def lookup(ticker):
+            self.calls.append(ticker)
+            return ticker.lower()
+
+        self.assertEqual(lookup('AAPL'), 'aapl')
+        self.assertEqual(lookup('AAPL'), 'aapl')
+        self.assertEqual(lookup('MSFT'), 'msft')
+        self.assertEqual(self.calls, ['AAPL', 'MSFT'])
+
+    def test_rejected_results_are_not_stored(self):
+        @cached(self.cache, timedelta(hours=1))
+        def lookup(ticker):
+            self.calls.append(ticker)
+            return 0
+
+        self.assertEqual(lookup('AAPL'), 0)
+        self.assertEqual(lookup('AAPL'), 0)
+        self.assertEqual(self.calls, ['AAPL', 'AAPL'])
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_custom_should_cache(self):
+        @cached(self.cache, timedelta(hours=1), should_cache=lambda stats: any(stats.values()))
+        def lookup(ticker):
+            self.calls.append(ticker)
+            return {'pe': None}
+
+        lookup('AAPL')
+        lookup('AAPL')
+        self.assertEqual(len(self.calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from indicators import moving_averages
+
+
+class MovingAveragesTest(unittest.TestCase):
+    def assert_matches_rolling(self, values, *windows):
+        averages = moving_averages(values, *windows)
+        self.assertEqual(len(averages), len(windows))
+        for window, average in zip(windows, averages):
+            expected = pd.Series(values, dtype=float).rolling(window).mean().to_numpy()
+            np.testing.assert_allclose(average, expected, equal_nan=True)
+
+    def test_matches_pandas_rolling_mean(self):
+        values = np.random.default_rng(0).uniform(50, 150, 300)
+        self.assert_matches_rolling(values, 50, 200)
+
+    def test_window_with_nan_is_nan(self):
+        values = np.arange(1.0, 31.0)
+        values[[3, 17]] = np.nan
+        self.assert_matches_rolling(values, 1, 5, 10)
+
+    def test_series_shorter_than_window(self):
+        self.assert_matches_rolling([1.0, 2.0, 3.0], 2, 5)
+
+    def test_empty_series(self):
+        self.assert_matches_rolling([], 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+
+from presentation import StockPresentationGenerator
+
+
+class TranslateRecommendationTest(unittest.TestCase):
+    def setUp(self):
+        # Skip __init__, which downloads the ticker's info
+        self.generator = StockPresentationGenerator.__new__(StockPresentationGenerator)
+
+    def test_yahoo_keys(self):
+        self.assertEqual(self.generator._translate_recommendation('strong_buy'), 'Strong Buy')
+        self.assertEqual(self.generator._translate_recommendation('strong_sell'), 'Strong Sell')
+        self.assertEqual(self.generator._translate_recommendation('hold'), 'Hold')
+
+    def test_unknown_key_is_returned_unchanged(self):
+        self.assertEqual(self.generator._translate_recommendation('N/A'), 'N/A')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import io
+import json
+import os
+import types
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import pandas as pd
+
+import stock
+
+
+def fake_client(payload):
+    """OpenAI client stub whose completion returns payload as the JSON message content"""
+    message = types.SimpleNamespace(content=json.dumps(payload))
+    completion = types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(
+        create=lambda **kwargs: completion)))
+
+
+class StockNarrativeTest(unittest.TestCase):
+    def narrative(self, payload):
+        # __wrapped__ skips the on-disk cache
+        with mock.patch.object(stock, 'get_openai_client', return_value=fake_client(payload)):
+            return stock.get_stock_narrative.__wrapped__('TEST')
+
+    def test_list_of_strings(self):
+        narrative = self.narrative({'strengths': ['- Brand: loyal customers', ' ', 'Scale'],
+                                    'catalysts': [], 'risks': ['Debt']})
+        self.assertEqual(narrative['strengths'], ['- Brand: loyal customers', '- Scale'])
+        self.assertEqual(narrative['catalysts'], [])
+        self.assertEqual(narrative['risks'], ['- Debt'])
+
+    def test_bare_string_is_one_point(self):
+        narrative = self.narrative({'strengths': 'Brand: loyal customers'})
+        self.assertEqual(narrative['strengths'], ['- Brand: loyal customers'])
+
+    def test_objects_are_joined(self):
+        narrative = self.narrative({'risks': [{'point': 'Debt', 'explanation': 'Refinancing risk'}]})
+        self.assertEqual(narrative['risks'], ['- Debt: Refinancing risk'])
+
+    def test_other_shapes_are_skipped(self):
+        narrative = self.narrative({'strengths': 3, 'catalysts': [None, 4, 'AI'], 'risks': None})
+        self.assertEqual(narrative, {'strengths': [], 'catalysts': ['- AI'], 'risks': []})
+
+
+def baseline_metric_color(metric_name, stock_value, comparable_value):
+    """get_metric_color as it was before get_metric_colors replaced it"""
+    if stock_value == 0 or comparable_value == 0:
+        return '#000000'
+    percentage_diff = ((stock_value - comparable_value) / comparable_value) * 100
+    if metric_name == "Dividend Yield":
+        if percentage_diff > 10:
+            return '#008000'
+        elif percentage_diff >= -10:
+            return '#FFA500'
+        return '#FF0000'
+    if percentage_diff < 0:
+        return '#008000'
+    elif percentage_diff <= 10:
+        return '#FFA500'
+    return '#FF0000'
+
+
+class MetricColorsTest(unittest.TestCase):
+    def test_matches_baseline(self):
+        peer = 20.0
+        stock_values = [0.0, 10.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 40.0, -5.0]
+        for name in ('P/E TTM', 'Dividend Yield', 'Price-to-FFO'):
+            names = [name] * len(stock_values)
+            expected = [baseline_metric_color(name, value, peer) for value in stock_values]
+            self.assertEqual(stock.get_metric_colors(names, stock_values, [peer] * len(stock_values)), expected)
+
+    def test_missing_peer_value_is_black(self):
+        self.assertEqual(stock.get_metric_colors(['P/E TTM', 'Dividend Yield'], [12.0, 3.0], [0, 0]),
+                         ['#000000', '#000000'])
+
+    def test_mixed_metrics(self):
+        names = ['P/E TTM', 'Dividend Yield', 'EV/EBITDA']
+        stock_values = [15.0, 4.0, 30.0]
+        peer_values = [20.0, 3.0, 20.0]
+        self.assertEqual(stock.get_metric_colors(names, stock_values, peer_values),
+                         [baseline_metric_color(*args) for args in zip(names, stock_values, peer_values)])
+
+
+def baseline_comparables(cells):
+    """Comparable tickers the way main() parsed a workbook column before load_comparables_map existed"""
+    tickers = []
+    for company in cells:
+        try:
+            company = company.strip('"')
+            parts = company.split("': '")
+            ticker = parts[1].rstrip("'") if len(parts) == 2 else company
+            if ticker and ticker.lower() != "private":
+                tickers.append(ticker)
+        except AttributeError:
+            # Non-text cells were skipped
+            continue
+    return tickers
+
+
+class ComparablesMapTest(unittest.TestCase):
+    def comparables_map(self, df):
+        # __wrapped__ skips the per-process lru_cache
+        with mock.patch.object(stock, 'read_workbook', return_value=df), redirect_stdout(io.StringIO()):
+            return stock.load_comparables_map.__wrapped__()
+
+    def assert_matches_baseline(self, df):
+        comparables_map = self.comparables_map(df)
+        self.assertEqual(list(comparables_map), list(df.columns))
+        for column in df.columns:
+            self.assertEqual(comparables_map[column], baseline_comparables(df[column].dropna().tolist()), column)
+
+    def test_cell_formats(self):
+        df = pd.DataFrame({
+            'AMZN': ["'Walmart Inc.': 'WMT'", "Amazon.com, Inc.': 'AMZN", "\"'Target': 'TGT'\"", "'Acme': 'private'"],
+            'ODD': ["no separator", "'A': 'B': 'C'", "'Empty': ''", None],
+            'NUM': [1.0, 2.0, None, None],
+        })
+        self.assert_matches_baseline(df)
+        self.assertEqual(self.comparables_map(df)['AMZN'], ['WMT', 'AMZN', 'TGT'])
+
+    def test_mixed_column(self):
+        self.assert_matches_baseline(pd.DataFrame({'MIX': ["'Walmart Inc.': 'WMT'", 3, "'Costco': 'COST'"]}, dtype=object))
+
+    def test_repository_workbook(self):
+        path = os.path.join(os.path.dirname(stock.__file__), stock.COMPARABLES_FILE)
+        self.assert_matches_baseline(pd.read_excel(path, sheet_name='Sheet1'))
+
+
+if __name__ == '__main__':
+    unittest.main()